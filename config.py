@@ -8,12 +8,46 @@ WEATHER_API_KEY = ""  # Add your API key here
 WEATHER_API_URL = "https://api.openweathermap.org/data/2.5/weather"
 AIR_QUALITY_API_URL = "https://api.openweathermap.org/data/2.5/air_pollution"
 
+# HTTP Transport Settings
+# Timeouts are split into (connect, read) seconds
+HTTP_CONNECT_TIMEOUT = 3.05
+HTTP_READ_TIMEOUT = 10
+# Keep-alive connections kept per host
+HTTP_POOL_SIZE = 2
+HTTP_POOL_SIZES = {
+    "https://api.open-meteo.com": 2,
+    "https://air-quality-api.open-meteo.com": 2,
+    "https://7code.co.kr": 2,
+}
+
+# HTTP Resilience Settings
+# Retries of transient failures (timeouts, connection errors, 5xx, 429)
+HTTP_RETRIES = 2
+HTTP_RETRY_BACKOFF = 500  # Milliseconds before the first retry, doubled per retry
+HTTP_RETRY_MAX_DELAY = 4000  # Longest wait between retries; a longer Retry-After is not waited for
+# Per-host circuit breaker
+CIRCUIT_FAILURE_THRESHOLD = 3  # Consecutive failed attempts that stop requests to a host
+CIRCUIT_OPEN_DURATION = 30000  # Milliseconds before a single probe request is let through
+CIRCUIT_MAX_OPEN_DURATION = 600000  # Cap for the open time, doubled per failed probe
+
+# HTTP Response Cache Settings
+HTTP_CACHE_DIR = "cache/http"
+HTTP_CACHE_MAX_BYTES = 2 * 1024 * 1024  # 2 MB
+# Cached responses younger than this are used without a request (milliseconds).
+# Kept below the refresh intervals so periodic refreshes always revalidate.
+WEATHER_CACHE_TTL = 540000  # 9 minutes
+CRYPTO_CACHE_TTL = 15000  # 15 seconds
+
 # Default location (Seoul, Korea)
 DEFAULT_CITY = "Seoul"
 DEFAULT_COUNTRY = "KR"
 DEFAULT_LAT = 37.5665
 DEFAULT_LON = 126.9780
 
+# Detected location is reused until it expires or the local network changes
+LOCATION_CACHE_FILE = "cache/location.json"
+LOCATION_CACHE_TTL = 86400000  # 24 hours (milliseconds)
+
 # Application Settings
 APP_NAME = "Desktop Clock & Weather"
 APP_VERSION = "1.0.0"
@@ -27,6 +61,47 @@ MIN_WINDOW_HEIGHT = 800
 # Update Intervals (in milliseconds)
 CLOCK_UPDATE_INTERVAL = 1000  # 1 second
 WEATHER_UPDATE_INTERVAL = 600000  # 10 minutes
+CRYPTO_UPDATE_INTERVAL = 30000  # 30 seconds
+# Shorter than CRYPTO_UPDATE_INTERVAL minus REFRESH_COALESCE_WINDOW, so a
+# refresh that runs early with other sources still goes to the network
+CRYPTO_SNAPSHOT_TTL = 25000  # 25 seconds
+SETTINGS_SAVE_DELAY = 500  # Quiet period before settings changes are written
+
+# Refresh scheduler (see src/services/refresh_scheduler.py)
+REFRESH_COALESCE_WINDOW = 2000  # Sources due within this window are fetched together
+REFRESH_FIRST_RETRY = 5000  # Retry delay after the first failure, doubled per further failure
+REFRESH_MAX_BACKOFF = 300000  # Retry delay cap (5 minutes) unless the interval is longer
+REFRESH_JITTER = 0.2  # Retry delays vary randomly by up to this fraction
+REFRESH_BACKGROUND_INTERVAL = 900000  # While the window is not visible, refresh at most every 15 minutes
+WORKER_SHUTDOWN_TIMEOUT = 2000  # Longest wait on quit for fetches in flight; later results are dropped
+
+# Data freshness (see src/services/data_store.py)
+# Older values are greyed out; past the max age they are replaced by placeholders
+WEATHER_STALE_AGE = 1200000  # 20 minutes, two missed weather refreshes
+WEATHER_MAX_AGE = 10800000  # 3 hours
+MARKET_STALE_AGE = 90000  # 90 seconds, three missed market refreshes
+MARKET_MAX_AGE = 1800000  # 30 minutes
+
+# Clock jump and resume-from-suspend detection
+CLOCK_WATCH_INTERVAL = 10000  # Compare wall, monotonic and boot clocks every 10 seconds
+CLOCK_JUMP_THRESHOLD = 2000  # Discrepancies above this are a jump or a resume
+
+# Last shown data, painted as stale on the next start while refreshes run
+APP_STATE_FILE = "app_state.json"
+APP_STATE_SAVE_DELAY = 2000  # Gather updates for this long before writing
+
+# Startup Profiling
+# Enable with the --profile-startup flag or this environment variable
+STARTUP_PROFILE_ENV = "DESKTOPCLOCK_PROFILE_STARTUP"
+STARTUP_PROFILE_FILE = "startup_profile.json"
+# --startup-benchmark fails if the first frame takes longer than this
+STARTUP_BUDGET_MS = 1500
+
+# Wakeup counting per power state (visible/suspended)
+# Enable with the --profile-wakeups flag or this environment variable
+WAKEUP_PROFILE_ENV = "DESKTOPCLOCK_PROFILE_WAKEUPS"
+WAKEUP_PROFILE_FILE = "wakeup_profile.json"
+VIEW_UPDATE_PROFILE_FILE = "view_update_profile.json"  # Widget properties applied vs. skipped
 
 # Theme Settings
 THEME_DARK = "dark"
@@ -37,3 +112,20 @@ DEFAULT_THEME = THEME_DARK
 CLOCK_MODE_DIGITAL = "digital"
 CLOCK_MODE_ANALOG = "analog"
 DEFAULT_CLOCK_MODE = CLOCK_MODE_ANALOG
+
+# Smooth-sweep second hand for the analog clock (frames per second, 0 = tick once per second)
+DEFAULT_SWEEP_FPS = 0
+SWEEP_FPS_LEVELS = [60, 30, 15]
+# Average paint time above which the sweep drops to the next lower frame rate
+SWEEP_PAINT_BUDGET_MS = 4.0
+# Set this environment variable to tint the regions the analog clock repaints
+DEBUG_REPAINT_ENV = "DESKTOPCLOCK_DEBUG_REPAINT"
+
+# Crypto Bar Settings
+CRYPTO_MODE_CAROUSEL = "carousel"  # One coin at a time, sliding every 5 seconds
+CRYPTO_MODE_TICKER = "ticker"  # Every coin in one continuously scrolling strip
+DEFAULT_CRYPTO_MODE = CRYPTO_MODE_CAROUSEL
+DEFAULT_CRYPTO_COINS = ['BTC', 'USDT', 'ETH', 'XRP', 'SOL']
+CRYPTO_MAX_COINS = 100  # Keeps the ticker strip within pixmap size limits
+CRYPTO_TICKER_SPEED = 40  # Pixels per second
+CRYPTO_TICKER_FPS = 30
@@ -3,23 +3,290 @@
 Desktop Clock & Weather Application
 Main entry point
 """
+import os
 import sys
-from PyQt5.QtWidgets import QApplication
-from src.ui.main_window import MainWindow
+
+import config
+from src.utils.instrumentation import frame_cost_us, profiler, view_updates, wakeup_meter
+
+# Enable profiling before the heavy imports so their cost is recorded
+PROFILE_STARTUP = '--profile-startup' in sys.argv or bool(os.environ.get(config.STARTUP_PROFILE_ENV))
+STARTUP_BENCHMARK = '--startup-benchmark' in sys.argv
+PROFILE_WAKEUPS = '--profile-wakeups' in sys.argv or bool(os.environ.get(config.WAKEUP_PROFILE_ENV))
+CRYPTO_BENCHMARK = '--crypto-benchmark' in sys.argv
+SETTINGS_BENCHMARK = '--settings-benchmark' in sys.argv
+CLOCK_BENCHMARK = '--clock-benchmark' in sys.argv
+WEATHER_BENCHMARK = '--weather-benchmark' in sys.argv
+PAINT_BENCHMARK = '--paint-benchmark' in sys.argv
+if PROFILE_STARTUP or STARTUP_BENCHMARK:
+    profiler.enable(config.STARTUP_PROFILE_FILE)
+
+with profiler.phase('imports'):
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QTimer
+    from src.ui.main_window import MainWindow
+    from src.services.fetch_worker import wait_for_workers
+    from src.services.http_client import get_http_client
+    from src.services.refresh_scheduler import get_refresh_scheduler
+    from src.utils.app_state import get_app_state
+
+
+def check_startup_budget(app):
+    """Quit with a non-zero exit code if the first frame missed the budget"""
+    profiler.write_report()
+    first_paint = profiler.marks.get('first_paint')
+    print(f"Time to first paint: {first_paint} ms (budget {config.STARTUP_BUDGET_MS} ms)")
+    if first_paint is None or first_paint > config.STARTUP_BUDGET_MS:
+        app.exit(1)
+    else:
+        app.exit(0)
+
+
+def run_crypto_benchmark():
+    """Print the per-frame cost of the label carousel and the ticker strip for 5 and 50 coins"""
+    from src.ui.crypto_widget import CryptoWidget
+
+    # Synthetic prices only: nothing is fetched or saved
+    get_refresh_scheduler().pause()
+    frames = 300
+    print(f"{'coins':>5} {'carousel slide':>16} {'ticker scroll':>15} {'strip re-render':>17}")
+    for count in (5, 50):
+        coins = [f"C{i:02d}" for i in range(count)]
+        widget = CryptoWidget(coins=coins)
+        widget.coin_index = widget.crypto_service.build_index([
+            {'symbol': f"{symbol}_KRW", 'closing_price': 1000000 + i * 12345, 'fluctate_rate': i % 7 - 3.0}
+            for i, symbol in enumerate(coins)
+        ])
+        widget.resize(800, 80)
+        widget.show()
+        QApplication.processEvents()  # Map the window so repaint() draws
+
+        widget.set_mode(config.CRYPTO_MODE_CAROUSEL)
+        widget.suspend()
+        group = widget.slide_out_group
+        widget.set_slide(group, widget.width())
+        carousel = frame_cost_us(widget, lambda frame: group.setCurrentTime(frame * 16 % 400), frames)
+        group.setCurrentTime(0)
+
+        widget.set_mode(config.CRYPTO_MODE_TICKER)
+        widget.suspend()
+        ticker = frame_cost_us(widget.ticker, lambda frame: widget.ticker.advance(), frames)
+
+        # A price change renders the whole strip once
+        rerender = frame_cost_us(widget.ticker, lambda frame: widget.ticker.set_items(
+            [(symbol, f"₩{frame},{i:03d}", 0.0) for i, symbol in enumerate(coins)]), 20)
+        print(f"{count:>5} {carousel:>13.0f} us {ticker:>12.0f} us {rerender:>14.0f} us")
+        widget.close()
+
+
+def run_settings_benchmark():
+    """Print how many times a simulated 2 second window drag writes the settings file"""
+    import tempfile
+    import time
+    from src.utils.settings_manager import SettingsManager
+
+    # Same calls per frame as MainWindow.resizeEvent plus a splitter move, at 60 Hz
+    duration = 2.0
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        settings = SettingsManager(os.path.join(tmp_dir, 'user_settings.json'))
+        calls = 0
+        start = time.monotonic()
+        frame = 0
+        while time.monotonic() - start < duration:
+            settings.set('window.width', 1200 + frame)
+            settings.set('window.height', 900 + frame)
+            settings.set('splitter.sizes', [400 + frame, 600])
+            calls += 3
+            frame += 1
+            time.sleep(1 / 60)
+        drag_writes = settings.write_count
+
+        # The quiet period after the drag writes the final size once
+        time.sleep(config.SETTINGS_SAVE_DELAY / 1000 * 2)
+        settings.close()
+        print(f"set() calls during the drag: {calls}")
+        print(f"Disk writes during the drag: {drag_writes}")
+        print(f"Disk writes in total: {settings.write_count} "
+              f"(save delay {config.SETTINGS_SAVE_DELAY} ms)")
+
+
+def run_clock_benchmark():
+    """Print the cost of one DigitalClock.update_time() tick and of a day rollover"""
+    import time
+    from datetime import datetime, timedelta
+    from src.widgets.digital_clock import DigitalClock
+
+    clock = DigitalClock()
+    clock.stop_ticking()  # Only the benchmark calls update_time()
+    calls = 5000
+    start_time = datetime(2025, 1, 15, 12, 0, 0)
+
+    # One call per second, as the tick engine drives it
+    start = time.perf_counter()
+    for i in range(calls):
+        clock.update_time(start_time + timedelta(seconds=i))
+    tick = (time.perf_counter() - start) / calls * 1e6
+
+    # Every call on a new day reformats the date as well
+    start = time.perf_counter()
+    for i in range(calls):
+        clock.update_time(start_time + timedelta(days=i, seconds=i))
+    rollover = (time.perf_counter() - start) / calls * 1e6
+
+    print(f"update_time() per second tick: {tick:.1f} us")
+    print(f"update_time() on a new day: {rollover:.1f} us")
+    clock.close()
+
+
+def run_weather_benchmark():
+    """Print the refresh latency of sequential vs. concurrent weather and air quality fetches"""
+    import json
+    import statistics
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from src.services.free_weather_service import FreeWeatherService
+    from src.services.http_client import HttpClient
+
+    def stand_in(delay):
+        """Start a local server answering every GET with an empty reading after delay seconds"""
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(delay)
+                body = json.dumps({'current': {}}).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    # Round-trip times in the range of the two Open-Meteo hosts
+    weather_server = stand_in(0.2)
+    air_quality_server = stand_in(0.15)
+    service = FreeWeatherService(http=HttpClient())
+    service.weather_url = f"http://127.0.0.1:{weather_server.server_port}/v1/forecast"
+    service.air_quality_url = f"http://127.0.0.1:{air_quality_server.server_port}/v1/air-quality"
+
+    def measure(fetch, runs=5):
+        """Median wall time of fetch() in milliseconds"""
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            fetch()
+            times.append((time.perf_counter() - start) * 1000)
+        return statistics.median(times)
+
+    sequential = measure(lambda: (service.get_weather(37.5, 127.0), service.get_air_quality(37.5, 127.0)))
+    concurrent = measure(lambda: service.get_snapshot(37.5, 127.0))
+    print("Stand-in latency: weather 200 ms, air quality 150 ms")
+    print(f"Sequential fetch: {sequential:.0f} ms")
+    print(f"Concurrent fetch: {concurrent:.0f} ms")
+
+    weather_server.shutdown()
+    air_quality_server.shutdown()
+
+
+def run_paint_benchmark():
+    """Print the per-frame cost of the analog clock at 400 and 1600 px"""
+    import time
+    from datetime import datetime, timedelta
+    from src.widgets.analog_clock import AnalogClock
+
+    frames = 120
+    start_time = datetime(2025, 1, 15, 10, 8, 0)
+    print(f"{'size':>6} {'full, dial redrawn':>20} {'full, cached dial':>19} {'hands only':>12}")
+    for side in (400, 1600):
+        clock = AnalogClock(sweep_fps=0)
+        clock.resize(side, side)
+        clock.show()
+        QApplication.processEvents()  # Map the window so repaint() draws
+        clock.stop_ticking()  # Only the benchmark moves the hands
+
+        def tick(frame, drop_dial=False):
+            if drop_dial:
+                clock.dial_cache = None
+            clock.advance(start_time + timedelta(seconds=frame))
+
+        # Every tick repaints the whole face, as before the dial was cached
+        uncached = frame_cost_us(clock, lambda frame: tick(frame, drop_dial=True), frames)
+        cached = frame_cost_us(clock, tick, frames)
+
+        # What a tick costs now: the dirty region of the old and new hands
+        start = time.perf_counter()
+        for frame in range(frames):
+            tick(frame)
+            QApplication.processEvents()
+        hands = (time.perf_counter() - start) / frames * 1e6
+
+        print(f"{side:>4}px {uncached:>17.0f} us {cached:>16.0f} us {hands:>9.0f} us")
+        clock.close()
 
 
 def main():
     """Main function to start the application"""
-    app = QApplication(sys.argv)
+    with profiler.phase('qapplication'):
+        app = QApplication(sys.argv)
     app.setApplicationName("Desktop Clock & Weather")
     app.setOrganizationName("DesktopClock")
+    if CRYPTO_BENCHMARK:
+        run_crypto_benchmark()
+        return
+    if SETTINGS_BENCHMARK:
+        run_settings_benchmark()
+        return
+    if CLOCK_BENCHMARK:
+        run_clock_benchmark()
+        return
+    if WEATHER_BENCHMARK:
+        run_weather_benchmark()
+        return
+    if PAINT_BENCHMARK:
+        run_paint_benchmark()
+        return
+    if PROFILE_WAKEUPS:
+        wakeup_meter.enable(app, config.WAKEUP_PROFILE_FILE)
+        view_updates.enable(config.VIEW_UPDATE_PROFILE_FILE)
+
+    # Load the last session's data so the first frame is not blank
+    with profiler.phase('app_state'):
+        app_state = get_app_state()
 
     # Create and show main window
-    window = MainWindow()
-    window.show()
+    with profiler.phase('main_window'):
+        window = MainWindow()
+    profiler.watch_first_paint(window)
+    with profiler.phase('show'):
+        window.show()
+
+    if STARTUP_BENCHMARK:
+        # Judge the first frame once the budget has elapsed
+        QTimer.singleShot(config.STARTUP_BUDGET_MS, lambda: check_startup_budget(app))
+    # Start no new fetches and let the ones in flight finish before teardown
+    app.aboutToQuit.connect(get_refresh_scheduler().pause)
+    app.aboutToQuit.connect(window.weather_widget.close_services)
+    app.aboutToQuit.connect(get_http_client().close)
+    app.aboutToQuit.connect(wait_for_workers)
+    app.aboutToQuit.connect(profiler.write_report)
+    app.aboutToQuit.connect(wakeup_meter.write_report)
+    app.aboutToQuit.connect(view_updates.write_report)
+    app.aboutToQuit.connect(window.settings.close)
+    app.aboutToQuit.connect(app_state.flush)
 
     # Start event loop
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+
+    # Hide the window while the shared tick engine still exists; hidden
+    # during interpreter teardown, its clocks would unsubscribe from a
+    # tick engine that may already be deleted
+    window.hide()
+    sys.exit(exit_code)
 
 
 if __name__ == '__main__':
@@ -1,17 +1,110 @@
 """
 Cryptocurrency service for fetching BTC data from 7code.co.kr API
 """
+import threading
+import time
 import requests
-from typing import Optional, Dict, List
+import config
+from typing import Optional, Dict, List, Tuple
+from src.services.http_client import HttpClient, get_http_client
 
 
 class CryptoService:
     """Service to fetch cryptocurrency data from 7code.co.kr"""
 
-    def __init__(self):
-        """Initialize the crypto service"""
+    def __init__(self, http: Optional[HttpClient] = None, ttl: int = config.CRYPTO_SNAPSHOT_TTL):
+        """
+        Initialize the crypto service
+
+        Args:
+            http: HTTP client to use (defaults to the shared pooled client)
+            ttl: Market snapshot lifetime in milliseconds
+        """
+        self.http = http or get_http_client()
         self.base_url = "https://7code.co.kr/api"
 
+        # Market snapshot cache, shared by every coin lookup. The index and
+        # its fetch time are replaced together as one tuple and never mutated,
+        # so readers take the reference without locking.
+        self.ttl = ttl
+        self.snapshot = (None, 0.0, 0.0)  # (index, monotonic fetch time, wall-clock data time)
+        self.lock = threading.Lock()  # Guards only the swap of self.snapshot
+
+    def get_market_snapshot(self) -> Optional[Dict[str, Dict]]:
+        """
+        Get the market list indexed by every coin alias
+
+        The whole /coins list is downloaded at most once per TTL and indexed
+        by symbol ('BTC_KRW'), bare symbol ('BTC') and name, so looking up
+        any number of coins costs one request per refresh interval.
+
+        Returns:
+            Dictionary mapping aliases to coin data or None if request fails
+        """
+        entry = self.get_market_entry()
+        return entry[0] if entry is not None else None
+
+    def get_market_entry(self) -> Optional[Tuple[Dict[str, Dict], float]]:
+        """
+        Get the market snapshot with when its data was fetched
+
+        Returns:
+            (alias index, fetch time in epoch seconds) or None if request
+            fails; a list served from the disk cache keeps its original time
+        """
+        index, fetched_at, data_time = self.snapshot
+        if index is not None and (time.monotonic() - fetched_at) * 1000 < self.ttl:
+            return index, data_time
+
+        # Fetch without the lock so a slow request never blocks other lookups
+        try:
+            coins, data_time = self.http.get_json_entry(f'{self.base_url}/coins', ttl=config.CRYPTO_CACHE_TTL)
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching market data: {e}")
+            return None
+        index = self.build_index(coins)
+        fetched_at = time.monotonic()
+
+        with self.lock:
+            # A concurrent lookup may have swapped in a newer snapshot meanwhile
+            if fetched_at > self.snapshot[1]:
+                self.snapshot = (index, fetched_at, data_time)
+        return index, data_time
+
+    def provider_status(self) -> Dict:
+        """
+        Get the circuit breaker state of the price server
+
+        Returns:
+            Dictionary with 'state', 'failures' and 'retry_in' seconds
+        """
+        return self.http.circuit_status(self.base_url)
+
+    @staticmethod
+    def build_index(coins: List[Dict]) -> Dict[str, Dict]:
+        """
+        Index a coin list by symbol, bare symbol and name
+
+        Earlier entries win when two coins share an alias, matching the
+        order a linear scan of the list would find them in.
+
+        Args:
+            coins: Coin list returned by the /coins endpoint
+
+        Returns:
+            Dictionary mapping aliases to coin data
+        """
+        index = {}
+        for coin in coins:
+            coin_symbol = coin.get('symbol', '')
+            aliases = [coin_symbol, coin.get('name')]
+            if coin_symbol.endswith('_KRW'):
+                aliases.append(coin_symbol[:-len('_KRW')])
+            for alias in aliases:
+                if alias:
+                    index.setdefault(alias, coin)
+        return index
+
     def get_btc_data(self) -> Optional[Dict]:
         """
         Get BTC data from coins API
@@ -23,7 +116,7 @@ class CryptoService:
 
     def get_coin_data(self, symbol: str) -> Optional[Dict]:
         """
-        Get coin data from coins API
+        Get coin data from the cached market snapshot
 
         Args:
             symbol: Coin symbol (e.g., 'BTC', 'ETH', 'XRP')
@@ -31,23 +124,13 @@ class CryptoService:
         Returns:
             Dictionary with coin data or None if request fails
         """
-        try:
-            response = requests.get(f'{self.base_url}/coins', timeout=10)
-            response.raise_for_status()
-            coins = response.json()
-
-            # Find coin in the list
-            for coin in coins:
-                coin_symbol = coin.get('symbol', '')
-                # Match symbol with or without _KRW suffix
-                if coin_symbol == f'{symbol}_KRW' or coin_symbol == symbol or coin.get('name') == symbol:
-                    return coin
-
-            return None
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching {symbol} data: {e}")
+        snapshot = self.get_market_snapshot()
+        if snapshot is None:
             return None
 
+        # Aliases cover the symbol with or without _KRW suffix and the name
+        return snapshot.get(symbol)
+
     @staticmethod
     def format_price(price: float) -> str:
         """Format price with appropriate separators"""
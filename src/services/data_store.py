@@ -0,0 +1,232 @@
+"""
+Observable store of the last good value of every data source
+"""
+import math
+import time
+from typing import Any, Dict, Optional
+
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+from src.utils.app_state import AppState, get_app_state
+
+FRESH = 'fresh'  # Younger than the stale age
+STALE = 'stale'  # Still shown, marked as old (also for restored values and unknown ages)
+EXPIRED = 'expired'  # Too old to show
+MISSING = 'missing'  # Never fetched
+
+
+class StoredValue:
+    """Last good value of a source with when it was fetched and how the last fetch went"""
+
+    def __init__(self, stale_age: int, max_age: int, persist: bool):
+        """
+        Initialize an empty entry
+
+        Args:
+            stale_age: Age in milliseconds after which the value is stale
+            max_age: Age in milliseconds after which the value is no longer shown
+            persist: Whether values are saved to the app state snapshot
+        """
+        self.stale_age = stale_age / 1000
+        self.max_age = max_age / 1000
+        self.persist = persist
+
+        self.value: Optional[Any] = None
+        self.fetched_at: Optional[float] = None  # Wall-clock epoch seconds, None if unknown
+        self.restored = False  # From a previous run or a cache, stale until the next put()
+        self.error: Optional[str] = None  # Error of the last fetch, cleared by a success
+        self.freshness = MISSING  # Freshness when changed was last emitted
+
+
+class DataStore(QObject):
+    """
+    Keeps the last good value per source so widgets never fall back to
+    placeholders because of one failed fetch
+
+    Services deliver through put() and fail(); widgets read through get()
+    and freshness() and repaint on changed, which is also emitted when a
+    value crosses its stale or max age.
+    """
+
+    changed = pyqtSignal(str)  # Source name
+
+    def __init__(self, app_state: Optional[AppState] = None, parent=None):
+        """
+        Initialize the store
+
+        Args:
+            app_state: Snapshot that persisted sources are seeded from and saved to
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.app_state = app_state or get_app_state()
+        self.entries: Dict[str, StoredValue] = {}
+
+        # Fires when the next value crosses its stale or max age
+        self.age_timer = QTimer(self)
+        self.age_timer.setSingleShot(True)
+        # A coarse timer may fire early, before the value has crossed the limit
+        self.age_timer.setTimerType(Qt.PreciseTimer)
+        self.age_timer.timeout.connect(self.check_ages)
+
+    def define(self, name: str, stale_age: int, max_age: int, persist: bool = True) -> None:
+        """
+        Add a source, seeding it from the app state snapshot
+
+        Defining a source again keeps the existing entry.
+
+        Args:
+            name: Source name (also the app state section)
+            stale_age: Age in milliseconds after which the value is stale
+            max_age: Age in milliseconds after which the value is no longer shown
+            persist: Whether values are saved to the app state snapshot
+        """
+        if name in self.entries:
+            return
+        entry = StoredValue(stale_age, max_age, persist)
+        self.entries[name] = entry
+        if persist and self.app_state.get(name) is not None:
+            entry.value = self.app_state.get(name)
+            entry.fetched_at = self.app_state.saved_at(name)
+            entry.restored = True
+            entry.freshness = self.compute_freshness(entry)
+        self.schedule_age_check()
+
+    def put(self, name: str, value: Any, fetched_at: Optional[float] = None) -> None:
+        """
+        Replace a source's value with a freshly fetched one
+
+        Args:
+            name: Source name
+            value: New value (JSON-serializable if the source persists)
+            fetched_at: When the value was fetched in epoch seconds (defaults
+                to now; older for a response served from a cache)
+        """
+        entry = self.entries[name]
+        entry.value = value
+        entry.fetched_at = time.time() if fetched_at is None else fetched_at
+        entry.restored = False
+        entry.error = None
+        if entry.persist:
+            self.app_state.put(name, value, saved_at=entry.fetched_at)
+        self.notify(name)
+
+    def seed(self, name: str, value: Any, fetched_at: Optional[float] = None) -> None:
+        """
+        Fill a source with a value from elsewhere (e.g. a disk cache) until the next fetch
+
+        The value is graded STALE until the next put(), or EXPIRED once too old.
+
+        Args:
+            name: Source name
+            value: Value to show
+            fetched_at: When the value was fetched in epoch seconds, None if unknown
+        """
+        entry = self.entries[name]
+        entry.value = value
+        entry.fetched_at = fetched_at
+        entry.restored = True
+        self.notify(name)
+
+    def fail(self, name: str, error: str) -> None:
+        """
+        Record a failed fetch, keeping the last good value
+
+        Args:
+            name: Source name
+            error: Error message
+        """
+        self.entries[name].error = error
+        self.notify(name)
+
+    def get(self, name: str) -> Optional[Any]:
+        """
+        Get a source's value if it is still young enough to show
+
+        Args:
+            name: Source name
+
+        Returns:
+            The value, or None if missing or expired
+        """
+        entry = self.entries[name]
+        if self.compute_freshness(entry) in (MISSING, EXPIRED):
+            return None
+        return entry.value
+
+    def freshness(self, name: str) -> str:
+        """Get FRESH, STALE, EXPIRED or MISSING for a source"""
+        return self.compute_freshness(self.entries[name])
+
+    def fetched_at(self, name: str) -> Optional[float]:
+        """Get when a source's value was fetched, in epoch seconds, or None if unknown"""
+        return self.entries[name].fetched_at
+
+    def error(self, name: str) -> Optional[str]:
+        """Get the error of a source's last fetch, or None if it succeeded"""
+        return self.entries[name].error
+
+    @staticmethod
+    def compute_freshness(entry: StoredValue) -> str:
+        """Grade an entry by its age"""
+        if entry.value is None:
+            return MISSING
+        if entry.fetched_at is None:
+            return STALE
+        # A wall clock set backwards must not make old data look new
+        age = max(0.0, time.time() - entry.fetched_at)
+        if age >= entry.max_age:
+            return EXPIRED
+        if age >= entry.stale_age or entry.restored:
+            return STALE
+        return FRESH
+
+    def notify(self, name: str) -> None:
+        """Emit changed for a source and re-arm the age timer"""
+        entry = self.entries[name]
+        entry.freshness = self.compute_freshness(entry)
+        self.schedule_age_check()
+        self.changed.emit(name)
+
+    def check_ages(self) -> None:
+        """Emit changed for every source whose value crossed its stale or max age"""
+        for name, entry in self.entries.items():
+            if self.compute_freshness(entry) != entry.freshness:
+                self.notify(name)
+        self.schedule_age_check()
+
+    def schedule_age_check(self) -> None:
+        """Arm the age timer for the next value to cross its stale or max age"""
+        now = time.time()
+        deadlines = []
+        for entry in self.entries.values():
+            if entry.value is None or entry.fetched_at is None:
+                continue
+            for limit in (entry.stale_age, entry.max_age):
+                deadline = entry.fetched_at + limit
+                if deadline > now:
+                    deadlines.append(deadline)
+                    break
+
+        if not deadlines:
+            self.age_timer.stop()
+            return
+        self.age_timer.start(int(math.ceil((min(deadlines) - now) * 1000)))
+
+
+_shared_store = None
+
+
+def get_data_store() -> DataStore:
+    """
+    Get the application-wide data store, creating it on first use
+
+    Must be called on the GUI thread after the QApplication exists.
+
+    Returns:
+        Shared DataStore instance
+    """
+    global _shared_store
+    if _shared_store is None:
+        _shared_store = DataStore()
+    return _shared_store
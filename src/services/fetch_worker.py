@@ -0,0 +1,89 @@
+"""
+Background fetch workers for running blocking service calls off the GUI thread
+"""
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+import config
+
+
+class FetchSignals(QObject):
+    """Signals emitted by a FetchWorker (delivered on the receiver's thread)"""
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class FetchWorker(QRunnable):
+    """Runnable that calls a blocking function on the global thread pool"""
+
+    def __init__(self, fn, *args, **kwargs):
+        """
+        Initialize the worker
+
+        Args:
+            fn: Blocking callable to run (e.g. a service method)
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = FetchSignals()
+
+    def run(self):
+        """Run the callable and emit its result"""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.emit('failed', str(e))
+            return
+        self.emit('finished', result)
+
+    def emit(self, name: str, value) -> None:
+        """Emit one of the worker's signals, dropping the value if the app has already deleted them"""
+        try:
+            getattr(self.signals, name).emit(value)
+        except RuntimeError:
+            pass  # Finished after shutdown: nobody is left to receive it
+
+
+def run_in_background(fn, *args, on_result=None, on_error=None, **kwargs) -> FetchWorker:
+    """
+    Run a blocking callable on the global thread pool
+
+    The callbacks should be bound methods of QObjects living on the GUI
+    thread so that Qt queues the call back onto that thread.
+
+    Args:
+        fn: Blocking callable to run
+        *args: Positional arguments for fn
+        on_result: Slot receiving the return value of fn
+        on_error: Slot receiving the error message if fn raises
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        The started worker
+    """
+    worker = FetchWorker(fn, *args, **kwargs)
+    if on_result is not None:
+        worker.signals.finished.connect(on_result)
+    if on_error is not None:
+        worker.signals.failed.connect(on_error)
+    QThreadPool.globalInstance().start(worker)
+    return worker
+
+
+def wait_for_workers(timeout: int = config.WORKER_SHUTDOWN_TIMEOUT) -> bool:
+    """
+    Drop queued workers and wait for the running ones (call on quit)
+
+    Args:
+        timeout: Longest wait in milliseconds
+
+    Returns:
+        True if every worker finished in time
+    """
+    pool = QThreadPool.globalInstance()
+    pool.clear()
+    return pool.waitForDone(timeout)
@@ -2,18 +2,49 @@
 Free weather service using Open-Meteo API (no API key required)
 """
 import requests
-from typing import Optional, Dict
+import config
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Tuple, Any
+from src.services.http_client import HttpClient, get_http_client
 
 
 class FreeWeatherService:
     """Service to fetch weather data from Open-Meteo API (free, no API key)"""
 
-    def __init__(self):
-        """Initialize the free weather service"""
+    def __init__(self, http: Optional[HttpClient] = None):
+        """
+        Initialize the free weather service
+
+        Args:
+            http: HTTP client to use (defaults to the shared pooled client)
+        """
+        self.http = http or get_http_client()
         self.weather_url = "https://api.open-meteo.com/v1/forecast"
         self.air_quality_url = "https://air-quality-api.open-meteo.com/v1/air-quality"
+        # Two workers so weather and air quality requests overlap
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='open-meteo')
+
+    @staticmethod
+    def weather_params(lat: float, lon: float) -> Dict:
+        """Build query parameters for the forecast endpoint"""
+        return {
+            'latitude': lat,
+            'longitude': lon,
+            'current': 'temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m',
+            'timezone': 'Asia/Seoul'
+        }
 
-    def get_weather(self, lat: float, lon: float) -> Optional[Dict]:
+    @staticmethod
+    def air_quality_params(lat: float, lon: float) -> Dict:
+        """Build query parameters for the air quality endpoint"""
+        return {
+            'latitude': lat,
+            'longitude': lon,
+            'current': 'pm2_5,pm10',
+            'timezone': 'Asia/Seoul'
+        }
+
+    def get_weather(self, lat: float, lon: float) -> Optional[Tuple[Dict, float]]:
         """
         Get current weather data
 
@@ -22,24 +53,16 @@ class FreeWeatherService:
             lon: Longitude
 
         Returns:
-            Dictionary with weather data or None if request fails
+            (weather data, fetch time in epoch seconds) or None if request fails
         """
-        params = {
-            'latitude': lat,
-            'longitude': lon,
-            'current': 'temperature_2m,relative_humidity_2m,weather_code,wind_speed_10m',
-            'timezone': 'Asia/Seoul'
-        }
-
         try:
-            response = requests.get(self.weather_url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            return self.http.get_json_entry(self.weather_url, params=self.weather_params(lat, lon),
+                                            ttl=config.WEATHER_CACHE_TTL)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching weather data: {e}")
             return None
 
-    def get_air_quality(self, lat: float, lon: float) -> Optional[Dict]:
+    def get_air_quality(self, lat: float, lon: float) -> Optional[Tuple[Dict, float]]:
         """
         Get air quality data
 
@@ -48,23 +71,79 @@ class FreeWeatherService:
             lon: Longitude
 
         Returns:
-            Dictionary with air quality data or None if request fails
+            (air quality data, fetch time in epoch seconds) or None if request fails
         """
-        params = {
-            'latitude': lat,
-            'longitude': lon,
-            'current': 'pm2_5,pm10',
-            'timezone': 'Asia/Seoul'
-        }
-
         try:
-            response = requests.get(self.air_quality_url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            return self.http.get_json_entry(self.air_quality_url, params=self.air_quality_params(lat, lon),
+                                            ttl=config.WEATHER_CACHE_TTL)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching air quality data: {e}")
             return None
 
+    def get_snapshot(self, lat: float, lon: float) -> Optional[Dict[str, Optional[Tuple[Dict, float]]]]:
+        """
+        Get weather and air quality data with both requests in flight at once
+
+        The two endpoints live on different hosts, so fetching them
+        concurrently makes the refresh take as long as the slower request
+        instead of the sum of both.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            Dictionary with 'weather' and 'air_quality' keys, each holding a
+            (body, fetch time in epoch seconds) pair or None if that request
+            failed, or None if both requests fail. A body served from the
+            disk cache keeps the time it was originally fetched.
+        """
+        weather_future = self.executor.submit(self.get_weather, lat, lon)
+        air_quality_future = self.executor.submit(self.get_air_quality, lat, lon)
+
+        snapshot = {
+            'weather': weather_future.result(),
+            'air_quality': air_quality_future.result()
+        }
+
+        if snapshot['weather'] is None and snapshot['air_quality'] is None:
+            return None
+        return snapshot
+
+    def get_cached_snapshot(self, lat: float, lon: float) -> Optional[Dict[str, Optional[Tuple[Any, float]]]]:
+        """
+        Get the last known weather and air quality data without network I/O
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            Dictionary with 'weather' and 'air_quality' keys, each holding a
+            (body, fetch time in epoch seconds) pair or None, or None if nothing is cached
+        """
+        snapshot = {
+            'weather': self.http.peek_json(self.weather_url, self.weather_params(lat, lon)),
+            'air_quality': self.http.peek_json(self.air_quality_url, self.air_quality_params(lat, lon))
+        }
+
+        if snapshot['weather'] is None and snapshot['air_quality'] is None:
+            return None
+        return snapshot
+
+    def close(self) -> None:
+        """Stop the worker threads without waiting, cancelling requests not started yet (call on quit)"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def provider_status(self) -> Dict:
+        """
+        Get the circuit breaker state of the weather server
+
+        Returns:
+            Dictionary with 'state', 'failures' and 'retry_in' seconds
+        """
+        return self.http.circuit_status(self.weather_url)
+
     @staticmethod
     def get_pm25_description(pm25: float) -> str:
         """
@@ -0,0 +1,239 @@
+"""
+Shared HTTP transport with pooled keep-alive connections for all services
+"""
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import config
+from src.services.response_cache import ResponseCache
+from src.services.resilience import CircuitBreaker, RetryPolicy
+
+
+class HttpClient:
+    """Pooled requests.Session shared by the data services"""
+
+    def __init__(self, connect_timeout: float = config.HTTP_CONNECT_TIMEOUT,
+                 read_timeout: float = config.HTTP_READ_TIMEOUT,
+                 pool_size: int = config.HTTP_POOL_SIZE,
+                 pool_sizes: Optional[Dict[str, int]] = None,
+                 cache: Optional[ResponseCache] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """
+        Initialize the HTTP client
+
+        Args:
+            connect_timeout: Seconds to wait for the TCP/TLS connection
+            read_timeout: Seconds to wait for the response
+            pool_size: Keep-alive connections kept per host by default
+            pool_sizes: Per-host pool sizes keyed by URL prefix
+            cache: Disk cache for JSON responses (optional)
+            retry_policy: Retries for transient failures (defaults to the config values)
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.closed = False  # Set on quit: requests in flight are no longer retried
+
+        # One circuit breaker per host, created on first request
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.breakers_lock = threading.Lock()
+        if pool_sizes is None:
+            pool_sizes = config.HTTP_POOL_SIZES
+
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = f"{config.APP_NAME}/{config.APP_VERSION}"
+
+        default_adapter = HTTPAdapter(pool_connections=max(len(pool_sizes), 1) + 4,
+                                      pool_maxsize=pool_size)
+        self.session.mount('http://', default_adapter)
+        self.session.mount('https://', default_adapter)
+
+        # Longer prefixes take precedence over the scheme-wide default adapter
+        for prefix, size in pool_sizes.items():
+            self.session.mount(prefix, HTTPAdapter(pool_connections=1, pool_maxsize=size))
+
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        """Get the circuit breaker of a URL's host"""
+        host = urlsplit(url).netloc
+        with self.breakers_lock:
+            breaker = self.breakers.get(host)
+            if breaker is None:
+                breaker = self.breakers[host] = CircuitBreaker(host)
+            return breaker
+
+    def circuit_status(self, url: str) -> Dict:
+        """
+        Get the circuit breaker state of a URL's host for display
+
+        Args:
+            url: Any URL on the host
+
+        Returns:
+            Dictionary with 'state' (see src.services.resilience), 'failures' and 'retry_in' seconds
+        """
+        return self.breaker_for(url).status()
+
+    def get(self, url: str, params: Optional[Dict] = None,
+            read_timeout: Optional[float] = None,
+            headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Send a GET request over the pooled session
+
+        Transient failures (timeouts, connection errors, 5xx, 429) are retried
+        with backoff and counted by the host's circuit breaker. While the
+        circuit is open, the request fails at once with CircuitOpenError.
+
+        Args:
+            url: Request URL
+            params: Query parameters (optional)
+            read_timeout: Override for the read timeout in seconds (optional)
+            headers: Extra request headers (optional)
+
+        Returns:
+            Response with a successful status code
+
+        Raises:
+            requests.exceptions.RequestException: On network or HTTP errors
+                (CircuitOpenError while the host is considered down)
+        """
+        timeout = self.timeout
+        if read_timeout is not None:
+            timeout = (self.timeout[0], read_timeout)
+
+        breaker = self.breaker_for(url)
+        retry = 0
+        while True:
+            probe = breaker.before_request()
+            try:
+                response = self.session.get(url, params=params, timeout=timeout, headers=headers)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                if not self.retry_policy.is_transient(e):
+                    breaker.record_success()  # The host answered
+                    raise
+                breaker.record_failure()
+
+                retry += 1
+                delay = self.retry_policy.delay(retry, e) if retry <= self.retry_policy.retries else None
+                # A retry into an open circuit would only be rejected after the
+                # wait, and after close() the app is quitting and waits for it
+                if delay is None or breaker.is_open() or self.closed:
+                    raise
+                time.sleep(delay)
+                continue
+            finally:
+                if probe:
+                    # Anything else escaping must not leave the host probed forever
+                    breaker.end_probe()
+
+            breaker.record_success()
+            return response
+
+    def get_json(self, url: str, params: Optional[Dict] = None,
+                 read_timeout: Optional[float] = None, ttl: Optional[int] = None):
+        """
+        Send a GET request and decode the JSON body
+
+        See get_json_entry() for how the ttl is applied.
+
+        Args:
+            url: Request URL
+            params: Query parameters (optional)
+            read_timeout: Override for the read timeout in seconds (optional)
+            ttl: Cache lifetime in milliseconds (optional, no caching if None)
+
+        Returns:
+            Decoded JSON body
+        """
+        return self.get_json_entry(url, params=params, read_timeout=read_timeout, ttl=ttl)[0]
+
+    def get_json_entry(self, url: str, params: Optional[Dict] = None,
+                       read_timeout: Optional[float] = None,
+                       ttl: Optional[int] = None) -> Tuple[Any, float]:
+        """
+        Send a GET request and decode the JSON body, with when the body was fetched
+
+        With a ttl, a cached body younger than ttl is returned without any
+        request. Older bodies are revalidated with If-None-Match and
+        If-Modified-Since when the server sent an ETag or Last-Modified.
+
+        Args:
+            url: Request URL
+            params: Query parameters (optional)
+            read_timeout: Override for the read timeout in seconds (optional)
+            ttl: Cache lifetime in milliseconds (optional, no caching if None)
+
+        Returns:
+            (decoded JSON body, wall-clock time it was fetched or revalidated),
+            the time being the cache entry's for a body served from the cache
+        """
+        if self.cache is None or ttl is None:
+            return self.get(url, params=params, read_timeout=read_timeout).json(), time.time()
+
+        entry = self.cache.lookup(url, params)
+        headers = {}
+        if entry is not None:
+            if (time.time() - entry['stored_at']) * 1000 < ttl:
+                return entry['body'], entry['stored_at']
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self.get(url, params=params, read_timeout=read_timeout, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(url, params, entry)
+            return entry['body'], time.time()
+
+        body = response.json()
+        self.cache.store(url, params, body,
+                         etag=response.headers.get('ETag'),
+                         last_modified=response.headers.get('Last-Modified'))
+        return body, time.time()
+
+    def peek_json(self, url: str, params: Optional[Dict] = None) -> Optional[Tuple[Any, float]]:
+        """
+        Get the last cached JSON body for a request without any network I/O
+
+        Args:
+            url: Request URL
+            params: Query parameters (optional)
+
+        Returns:
+            (body, wall-clock time it was fetched) regardless of its age,
+            or None if nothing is cached
+        """
+        if self.cache is None:
+            return None
+        entry = self.cache.lookup(url, params)
+        return (entry['body'], entry['stored_at']) if entry is not None else None
+
+    def close(self) -> None:
+        """Close all pooled connections and stop retrying requests still in flight"""
+        self.closed = True
+        self.session.close()
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Get the process-wide HTTP client, creating it on first use
+
+    Returns:
+        Shared HttpClient instance
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient(
+                cache=ResponseCache(config.HTTP_CACHE_DIR, config.HTTP_CACHE_MAX_BYTES)
+            )
+        return _shared_client
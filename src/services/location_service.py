@@ -1,15 +1,47 @@
 """
 Location service for detecting user's location based on IP
 """
+import json
+import os
+import socket
+import tempfile
+import time
 import requests
+import config
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Dict
+from src.services.http_client import HttpClient, get_http_client
+
+# Geolocation providers answer quickly or not at all
+LOOKUP_READ_TIMEOUT = 5
+
+DEFAULT_LOCATION = {
+    'city': config.DEFAULT_CITY,
+    'latitude': config.DEFAULT_LAT,
+    'longitude': config.DEFAULT_LON,
+    'country': 'South Korea',
+    'region': 'Seoul'
+}
 
 
 class LocationService:
     """Service to detect user's location"""
 
-    @staticmethod
-    def get_location_by_ip() -> Optional[Dict]:
+    def __init__(self, http: Optional[HttpClient] = None,
+                 cache_file: str = config.LOCATION_CACHE_FILE):
+        """
+        Initialize the location service
+
+        Args:
+            http: HTTP client to use (defaults to the shared pooled client)
+            cache_file: Path of the persisted detection result
+        """
+        self.http = http or get_http_client()
+        self.cache_file = cache_file
+        # One worker per provider so both lookups race
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='geoip')
+
+    def get_location_by_ip(self) -> Optional[Dict]:
         """
         Get location based on IP address
 
@@ -18,9 +50,8 @@ class LocationService:
         """
         try:
             # Use ip-api.com (free, no API key required)
-            response = requests.get('http://ip-api.com/json/', timeout=5)
-            response.raise_for_status()
-            data = response.json()
+            data = self.http.get_json('http://ip-api.com/json/',
+                                      read_timeout=LOOKUP_READ_TIMEOUT)
 
             if data.get('status') == 'success':
                 return {
@@ -35,8 +66,7 @@ class LocationService:
 
         return None
 
-    @staticmethod
-    def get_location_by_ip_alternative() -> Optional[Dict]:
+    def get_location_by_ip_alternative(self) -> Optional[Dict]:
         """
         Alternative method using ipapi.co (backup)
 
@@ -44,9 +74,8 @@ class LocationService:
             Dictionary with location data or None if request fails
         """
         try:
-            response = requests.get('https://ipapi.co/json/', timeout=5)
-            response.raise_for_status()
-            data = response.json()
+            data = self.http.get_json('https://ipapi.co/json/',
+                                      read_timeout=LOOKUP_READ_TIMEOUT)
 
             return {
                 'city': data.get('city', 'Unknown'),
@@ -61,29 +90,132 @@ class LocationService:
         return None
 
     @staticmethod
-    def detect_location() -> Dict:
+    def is_valid(location: Optional[Dict]) -> bool:
+        """Check that a lookup result carries usable coordinates"""
+        return bool(location and location.get('latitude') and location.get('longitude'))
+
+    @staticmethod
+    def get_network_fingerprint() -> Optional[str]:
         """
-        Detect user's location, trying multiple methods
+        Identify the network the machine is currently on
+
+        Connecting a UDP socket selects the outbound interface without
+        sending any packets; its local address changes when the machine
+        moves to another network.
 
         Returns:
-            Dictionary with location data, falls back to Seoul if detection fails
+            Local outbound IP address or None if offline
         """
-        # Try primary method
-        location = LocationService.get_location_by_ip()
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.connect(('8.8.8.8', 80))
+                return sock.getsockname()[0]
+        except OSError:
+            return None
 
-        # Try alternative if primary fails
-        if not location:
-            location = LocationService.get_location_by_ip_alternative()
+    def load_cached_entry(self) -> Optional[Dict]:
+        """
+        Load the persisted detection result
 
-        # Fall back to Seoul if both fail
-        if not location or not location.get('latitude') or not location.get('longitude'):
-            print("Location detection failed, using default (Seoul)")
-            return {
-                'city': 'Seoul',
-                'latitude': 37.5665,
-                'longitude': 126.9780,
-                'country': 'South Korea',
-                'region': 'Seoul'
-            }
+        Returns:
+            Dictionary with 'location', 'detected_at' and 'network' keys or None
+        """
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or not self.is_valid(entry.get('location')):
+            return None
+        return entry
+
+    def save_cached_entry(self, location: Dict, network: Optional[str]) -> None:
+        """
+        Persist a detection result atomically
+
+        Args:
+            location: Detected location
+            network: Network fingerprint at detection time
+        """
+        entry = {
+            'location': location,
+            'detected_at': time.time(),
+            'network': network
+        }
+        try:
+            cache_dir = os.path.dirname(self.cache_file) or '.'
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            print(f"Error saving location: {e}")
+
+    def get_cached_location(self) -> Dict:
+        """
+        Get the last detected location without any network I/O
+
+        Returns:
+            Persisted location regardless of its age, or the default (Seoul)
+        """
+        entry = self.load_cached_entry()
+        if entry is None:
+            return dict(DEFAULT_LOCATION)
+        return entry['location']
+
+    def race_providers(self) -> Optional[Dict]:
+        """
+        Query both geolocation providers at once and take the first valid answer
+
+        Returns:
+            Dictionary with location data or None if both providers fail
+        """
+        futures = [
+            self.executor.submit(self.get_location_by_ip),
+            self.executor.submit(self.get_location_by_ip_alternative)
+        ]
+        for future in as_completed(futures):
+            location = future.result()
+            if self.is_valid(location):
+                # The slower lookup finishes in the background and is ignored
+                return location
+        return None
+
+    def close(self) -> None:
+        """Stop the worker threads without waiting, cancelling lookups not started yet (call on quit)"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def detect_location(self) -> Dict:
+        """
+        Detect user's location, reusing the persisted result when possible
+
+        The persisted result is reused while it is younger than
+        LOCATION_CACHE_TTL and the network has not changed. Otherwise both
+        providers are raced. Blocks on the network, so call it off the GUI
+        thread.
+
+        Returns:
+            Dictionary with location data, falls back to the last known
+            location or Seoul if detection fails
+        """
+        network = self.get_network_fingerprint()
+        entry = self.load_cached_entry()
+
+        if entry is not None:
+            age = (time.time() - entry.get('detected_at', 0)) * 1000
+            if 0 <= age < config.LOCATION_CACHE_TTL and entry.get('network') == network:
+                return entry['location']
+
+        location = self.race_providers()
+        if location is not None:
+            self.save_cached_entry(location, network)
+            return location
+
+        if entry is not None:
+            print("Location detection failed, using last known location")
+            return entry['location']
 
-        return location
+        print("Location detection failed, using default (Seoul)")
+        return dict(DEFAULT_LOCATION)
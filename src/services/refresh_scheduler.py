@@ -0,0 +1,283 @@
+"""
+Central scheduler for every periodically refreshed data source
+"""
+import math
+import random
+import time
+from typing import Callable, Dict, Optional
+
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+from src.services.fetch_worker import run_in_background
+import config
+
+
+class RefreshSource:
+    """A data source the scheduler fetches on a worker thread and delivers on the GUI thread"""
+
+    def __init__(self, name: str, fetch: Callable, on_result: Callable, interval: int,
+                 on_error: Optional[Callable] = None):
+        """
+        Initialize the source
+
+        Args:
+            name: Unique source name (e.g. 'weather')
+            fetch: Blocking callable returning data, or None on failure
+            on_result: Slot receiving the data on the GUI thread
+            interval: Refresh interval in milliseconds
+            on_error: Slot receiving an error message when a fetch fails
+        """
+        self.name = name
+        self.fetch = fetch
+        self.on_result = on_result
+        self.on_error = on_error
+        self.interval = interval
+
+        self.due = 0.0  # Monotonic time of the next fetch
+        self.in_flight = False
+        self.refresh_requested = False  # Refetch as soon as the current fetch ends
+        self.failures = 0  # Consecutive failed fetches
+        self.last_success: Optional[float] = None  # Monotonic time
+
+
+class RefreshScheduler(QObject):
+    """Runs every registered source on one timer, coalescing sources that fall due together"""
+
+    source_refreshed = pyqtSignal(str)  # Source name
+    source_failed = pyqtSignal(str, int)  # Source name, consecutive failures
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sources: Dict[str, RefreshSource] = {}
+        self.workers = {}  # Keep worker references until they report back
+        self.paused = False
+        self.background = False  # Poll at the background cadence
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        # A coarse timer may fire early, finding nothing due and waking twice
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.dispatch_due)
+
+    def register(self, name: str, fetch: Callable, on_result: Callable, interval: int,
+                 on_error: Optional[Callable] = None, delay: int = 0) -> RefreshSource:
+        """
+        Add a periodically refreshed source
+
+        Args:
+            name: Unique source name
+            fetch: Blocking callable returning data, or None on failure (runs on a worker thread)
+            on_result: Slot receiving the data (should be a bound method of a GUI-thread QObject)
+            interval: Refresh interval in milliseconds
+            on_error: Slot receiving an error message when a fetch fails
+            delay: Milliseconds until the first fetch
+
+        Returns:
+            The registered source
+        """
+        source = RefreshSource(name, fetch, on_result, interval, on_error)
+        source.due = time.monotonic() + delay / 1000
+        self.sources[name] = source
+        self.schedule()
+        return source
+
+    def unregister(self, name: str) -> None:
+        """Remove a source; a fetch in flight is discarded"""
+        self.sources.pop(name, None)
+        self.schedule()
+
+    def refresh(self, name: str) -> None:
+        """
+        Fetch a source as soon as possible
+
+        A refresh requested while the source is being fetched is merged into
+        one more fetch after the current one ends.
+
+        Args:
+            name: Source name
+        """
+        source = self.sources.get(name)
+        if source is None:
+            return
+        if source.in_flight:
+            source.refresh_requested = True
+            return
+        source.due = time.monotonic()
+        self.dispatch_due()
+
+    def refresh_all(self) -> None:
+        """Fetch every source as soon as possible, together"""
+        now = time.monotonic()
+        for source in self.sources.values():
+            if source.in_flight:
+                source.refresh_requested = True
+            else:
+                source.due = now
+        self.dispatch_due()
+
+    def refresh_stale(self, extra_age: int = 0) -> None:
+        """
+        Fetch at once, together, every source whose data is older than its interval
+
+        Args:
+            extra_age: Milliseconds to add to every age, for time the
+                monotonic clock did not count (e.g. a system suspend)
+        """
+        now = time.monotonic()
+        for source in self.sources.values():
+            if source.last_success is None:
+                continue  # Never fetched: already due or retrying
+            age = (now - source.last_success) * 1000 + extra_age
+            if age < self.effective_interval(source):
+                continue
+            if source.in_flight:
+                source.refresh_requested = True
+            else:
+                source.due = now
+        self.dispatch_due()
+
+    def pause(self) -> None:
+        """Stop starting fetches until resume(); fetches in flight still deliver"""
+        self.paused = True
+        self.timer.stop()
+
+    def resume(self) -> None:
+        """Start fetching again, at once for sources that fell due while paused"""
+        self.paused = False
+        self.dispatch_due()
+
+    def set_background(self, background: bool) -> None:
+        """
+        Switch between each source's own interval and the slow background cadence
+
+        Sources are re-timed from their last success, so returning to the
+        foreground at once refreshes every source that is now overdue.
+
+        Args:
+            background: True while nothing is on screen
+        """
+        if background == self.background:
+            return
+        self.background = background
+        for source in self.sources.values():
+            if not source.in_flight and source.failures == 0 and source.last_success is not None:
+                source.due = source.last_success + self.effective_interval(source) / 1000
+        self.dispatch_due()
+
+    def effective_interval(self, source: RefreshSource) -> int:
+        """Get the refresh interval of a source in the current cadence, in milliseconds"""
+        if self.background:
+            return max(source.interval, config.REFRESH_BACKGROUND_INTERVAL)
+        return source.interval
+
+    def schedule(self) -> None:
+        """Arm the timer for the earliest due source"""
+        waiting = [source.due for source in self.sources.values() if not source.in_flight]
+        if self.paused or not waiting:
+            self.timer.stop()
+            return
+
+        delay = (min(waiting) - time.monotonic()) * 1000
+        self.timer.start(max(0, int(math.ceil(delay))))
+
+    def dispatch_due(self) -> None:
+        """Start every source due now or within the coalescing window"""
+        if self.paused:
+            return
+
+        now = time.monotonic()
+        waiting = [source for source in self.sources.values() if not source.in_flight]
+        if not any(source.due <= now for source in waiting):
+            self.schedule()
+            return
+
+        # Sources due shortly after one that is due now ride along with it, so
+        # the radio and CPU wake once per burst instead of once per source
+        horizon = now + config.REFRESH_COALESCE_WINDOW / 1000
+        for source in waiting:
+            if source.due <= horizon:
+                self.dispatch(source)
+        self.schedule()
+
+    def dispatch(self, source: RefreshSource) -> None:
+        """Start fetching a source on the thread pool"""
+        source.in_flight = True
+        source.refresh_requested = False
+        self.workers[source.name] = run_in_background(
+            self.run_fetch, source.name, source.fetch,
+            on_result=self.on_fetch_done
+        )
+
+    @staticmethod
+    def run_fetch(name: str, fetch: Callable):
+        """Call a fetch function on a worker thread, capturing any error with the source name"""
+        try:
+            return name, fetch(), None
+        except Exception as e:
+            return name, None, str(e)
+
+    def on_fetch_done(self, outcome) -> None:
+        """Deliver a fetch result on the GUI thread and schedule the next fetch"""
+        name, result, error = outcome
+        self.workers.pop(name, None)
+        source = self.sources.get(name)
+        if source is None:
+            return  # Unregistered while in flight
+
+        source.in_flight = False
+        now = time.monotonic()
+        if error is None and result is not None:
+            source.failures = 0
+            source.last_success = now
+            source.due = now + self.effective_interval(source) / 1000
+            source.on_result(result)
+            self.source_refreshed.emit(name)
+        else:
+            source.failures += 1
+            source.due = now + self.retry_delay(source) / 1000
+            if error is not None:
+                print(f"Error refreshing {name}: {error}")
+            if source.on_error is not None:
+                source.on_error(error or "No data")
+            self.source_failed.emit(name, source.failures)
+
+        if source.refresh_requested:
+            source.due = now
+        self.dispatch_due()
+
+    def retry_delay(self, source: RefreshSource) -> float:
+        """
+        Get the delay before retrying a failing source
+
+        The first retry is quick to ride out a blip; after that the delay
+        doubles up to the larger of the source interval and the backoff cap.
+        Jitter keeps clients that failed together from retrying together.
+
+        Args:
+            source: Source that just failed
+
+        Returns:
+            Delay in milliseconds
+        """
+        delay = config.REFRESH_FIRST_RETRY * 2 ** (source.failures - 1)
+        delay = min(delay, max(self.effective_interval(source), config.REFRESH_MAX_BACKOFF))
+        jitter = config.REFRESH_JITTER
+        return delay * random.uniform(1 - jitter, 1 + jitter)
+
+
+_shared_scheduler = None
+
+
+def get_refresh_scheduler() -> RefreshScheduler:
+    """
+    Get the application-wide refresh scheduler, creating it on first use
+
+    Must be called on the GUI thread after the QApplication exists.
+
+    Returns:
+        Shared RefreshScheduler instance
+    """
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        _shared_scheduler = RefreshScheduler()
+    return _shared_scheduler
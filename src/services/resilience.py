@@ -0,0 +1,184 @@
+"""
+Retry policy and per-host circuit breaker for outgoing HTTP requests
+"""
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+import config
+
+CIRCUIT_CLOSED = 'closed'  # Requests flow normally
+CIRCUIT_OPEN = 'open'  # Requests fail at once without touching the network
+CIRCUIT_HALF_OPEN = 'half_open'  # One probe request decides whether to close again
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+class RetryPolicy:
+    """Decides which failures are worth retrying and how long to wait before each retry"""
+
+    def __init__(self, retries: int = config.HTTP_RETRIES,
+                 backoff: int = config.HTTP_RETRY_BACKOFF,
+                 max_delay: int = config.HTTP_RETRY_MAX_DELAY):
+        """
+        Initialize the policy
+
+        Args:
+            retries: Retries after the first attempt
+            backoff: Delay before the first retry in milliseconds, doubled per retry
+            max_delay: Longest delay in milliseconds; a longer Retry-After is not waited for
+        """
+        self.retries = retries
+        self.backoff = backoff / 1000
+        self.max_delay = max_delay / 1000
+
+    @staticmethod
+    def is_transient(error: requests.exceptions.RequestException) -> bool:
+        """
+        Check whether a failure may go away on its own
+
+        Timeouts, connection errors, 5xx and 429 are transient; other 4xx
+        mean the request itself is wrong and will fail again.
+
+        Args:
+            error: Exception raised by the request
+
+        Returns:
+            True if retrying may help
+        """
+        if isinstance(error, CircuitOpenError):
+            return False
+        if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+            return True
+        response = getattr(error, 'response', None)
+        if response is None:
+            return False
+        return response.status_code == 429 or response.status_code >= 500
+
+    def delay(self, retry: int, error: requests.exceptions.RequestException) -> Optional[float]:
+        """
+        Get the wait before a retry
+
+        Args:
+            retry: Retry number, starting at 1
+            error: Exception raised by the previous attempt
+
+        Returns:
+            Seconds to wait, or None if the server asked for more than max_delay
+        """
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after is not None and retry_after.isdigit():
+            seconds = float(retry_after)
+            return seconds if seconds <= self.max_delay else None
+
+        # Full jitter keeps threads that failed together from retrying together
+        return random.uniform(0, min(self.backoff * 2 ** (retry - 1), self.max_delay))
+
+
+class CircuitBreaker:
+    """Stops calling a host after repeated transient failures and probes it before resuming"""
+
+    def __init__(self, host: str,
+                 failure_threshold: int = config.CIRCUIT_FAILURE_THRESHOLD,
+                 open_duration: int = config.CIRCUIT_OPEN_DURATION,
+                 max_open_duration: int = config.CIRCUIT_MAX_OPEN_DURATION):
+        """
+        Initialize a closed breaker
+
+        Args:
+            host: Host name, for error messages
+            failure_threshold: Consecutive failed attempts that open the circuit
+            open_duration: Milliseconds the circuit stays open before the first probe
+            max_open_duration: Cap in milliseconds for the open time, which doubles per failed probe
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.base_open_duration = open_duration / 1000
+        self.max_open_duration = max_open_duration / 1000
+        self.lock = threading.Lock()
+
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self.open_duration = self.base_open_duration
+        self.opened_at = 0.0  # Monotonic time
+        self.probe_in_flight = False
+
+    def before_request(self) -> bool:
+        """
+        Let a request through or reject it
+
+        Returns:
+            True if the request is the half-open probe, which must end in
+            record_success(), record_failure() or end_probe()
+
+        Raises:
+            CircuitOpenError: While the circuit is open, or while a probe is in flight
+        """
+        with self.lock:
+            if self.state == CIRCUIT_OPEN:
+                if time.monotonic() - self.opened_at < self.open_duration:
+                    raise CircuitOpenError(f"{self.host} is not responding, not retrying yet")
+                self.state = CIRCUIT_HALF_OPEN
+
+            if self.state == CIRCUIT_HALF_OPEN:
+                if self.probe_in_flight:
+                    raise CircuitOpenError(f"{self.host} is being probed")
+                self.probe_in_flight = True
+                return True
+            return False
+
+    def end_probe(self) -> None:
+        """Free the probe slot if the probe ended without a verdict (e.g. an unexpected exception)"""
+        with self.lock:
+            if self.state == CIRCUIT_HALF_OPEN:
+                self.probe_in_flight = False
+
+    def is_open(self) -> bool:
+        """Check whether requests are currently rejected without a probe"""
+        with self.lock:
+            return self.state == CIRCUIT_OPEN
+
+    def record_success(self) -> None:
+        """Close the circuit after a response from the host"""
+        with self.lock:
+            self.state = CIRCUIT_CLOSED
+            self.failures = 0
+            self.open_duration = self.base_open_duration
+            self.probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit at the threshold or on a failed probe"""
+        with self.lock:
+            self.failures += 1
+            if self.state == CIRCUIT_HALF_OPEN:
+                self.probe_in_flight = False
+                self.open_duration = min(self.open_duration * 2, self.max_open_duration)
+                self.open()
+            elif self.failures >= self.failure_threshold:
+                self.open()
+
+    def open(self) -> None:
+        """Start rejecting requests (lock held)"""
+        if self.state != CIRCUIT_OPEN:
+            print(f"Circuit opened for {self.host} for {self.open_duration:.0f} s")
+        self.state = CIRCUIT_OPEN
+        self.opened_at = time.monotonic()
+
+    def status(self) -> Dict:
+        """
+        Get the breaker state for display
+
+        Returns:
+            Dictionary with state, consecutive failures and seconds until the next probe
+        """
+        with self.lock:
+            retry_in = 0.0
+            if self.state == CIRCUIT_OPEN:
+                retry_in = max(0.0, self.open_duration - (time.monotonic() - self.opened_at))
+            return {'state': self.state, 'failures': self.failures, 'retry_in': retry_in}
@@ -0,0 +1,162 @@
+"""
+Disk-backed HTTP response cache with LRU eviction and atomic writes
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class ResponseCache:
+    """Stores decoded JSON responses on disk, keyed by URL and query parameters"""
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Initialize the response cache
+
+        Args:
+            cache_dir: Directory holding one file per cached response
+            max_bytes: Total size above which least recently used entries are evicted
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+        # Entry file name -> size in bytes, ordered from least to most recently used
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.load_index()
+
+    def load_index(self) -> None:
+        """Build the LRU index from the files already on disk"""
+        try:
+            names = [name for name in os.listdir(self.cache_dir) if name.endswith('.json')]
+        except OSError:
+            return
+
+        stats = []
+        for name in names:
+            try:
+                stats.append((name, os.stat(os.path.join(self.cache_dir, name))))
+            except OSError:
+                continue
+
+        # File modification time records the last access
+        for name, stat in sorted(stats, key=lambda item: item[1].st_mtime):
+            self.entries[name] = stat.st_size
+            self.total_bytes += stat.st_size
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """
+        Build the cache file name for a request
+
+        Args:
+            url: Request URL
+            params: Query parameters (optional)
+
+        Returns:
+            File name derived from the URL and sorted parameters
+        """
+        raw = json.dumps([url, sorted((params or {}).items())], default=str)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest() + '.json'
+
+    def lookup(self, url: str, params: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached entry regardless of its age
+
+        Args:
+            url: Request URL
+            params: Query parameters (optional)
+
+        Returns:
+            Entry dictionary with 'body', 'stored_at', 'etag' and
+            'last_modified' keys, or None if nothing is cached
+        """
+        name = self.make_key(url, params)
+        with self.lock:
+            if name not in self.entries:
+                return None
+            path = os.path.join(self.cache_dir, name)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                os.utime(path)
+            except (OSError, ValueError):
+                self.remove(name)
+                return None
+            self.entries.move_to_end(name)
+            return entry
+
+    def store(self, url: str, params: Optional[Dict], body: Any,
+              etag: Optional[str] = None, last_modified: Optional[str] = None,
+              stored_at: Optional[float] = None) -> None:
+        """
+        Store a decoded response body
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            body: Decoded JSON body
+            etag: ETag response header (optional)
+            last_modified: Last-Modified response header (optional)
+            stored_at: Wall-clock time the body was fetched (defaults to now)
+        """
+        entry = {
+            'url': url,
+            'stored_at': time.time() if stored_at is None else stored_at,
+            'etag': etag,
+            'last_modified': last_modified,
+            'body': body
+        }
+        data = json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        name = self.make_key(url, params)
+
+        with self.lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                # Write to a temp file first so readers never see a partial entry
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(data)
+                    os.replace(tmp_path, os.path.join(self.cache_dir, name))
+                except OSError:
+                    os.unlink(tmp_path)
+                    raise
+            except OSError as e:
+                print(f"Error writing response cache: {e}")
+                return
+
+            self.total_bytes += len(data) - self.entries.pop(name, 0)
+            self.entries[name] = len(data)
+            self.evict()
+
+    def touch(self, url: str, params: Optional[Dict], entry: Dict[str, Any]) -> None:
+        """
+        Mark a cached entry as freshly validated (e.g. after a 304 response)
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            entry: Entry previously returned by lookup()
+        """
+        self.store(url, params, entry['body'], entry.get('etag'), entry.get('last_modified'))
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits its size limit"""
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            name = next(iter(self.entries))
+            self.remove(name)
+
+    def remove(self, name: str) -> None:
+        """Remove an entry file and forget it"""
+        self.total_bytes -= self.entries.pop(name, 0)
+        try:
+            os.remove(os.path.join(self.cache_dir, name))
+        except OSError:
+            pass
@@ -3,19 +3,22 @@ Weather service for fetching weather data from OpenWeatherMap API
 """
 import requests
 from typing import Optional, Dict
+from src.services.http_client import HttpClient, get_http_client
 
 
 class WeatherService:
     """Service to fetch weather and air quality data"""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http: Optional[HttpClient] = None):
         """
         Initialize the weather service
 
         Args:
             api_key: OpenWeatherMap API key
+            http: HTTP client to use (defaults to the shared pooled client)
         """
         self.api_key = api_key
+        self.http = http or get_http_client()
         self.weather_url = "https://api.openweathermap.org/data/2.5/weather"
         self.air_quality_url = "https://api.openweathermap.org/data/2.5/air_pollution"
 
@@ -49,9 +52,7 @@ class WeatherService:
             return None
 
         try:
-            response = requests.get(self.weather_url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            return self.http.get_json(self.weather_url, params=params)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching weather data: {e}")
             return None
@@ -77,9 +78,7 @@ class WeatherService:
         }
 
         try:
-            response = requests.get(self.air_quality_url, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            return self.http.get_json(self.air_quality_url, params=params)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching air quality data: {e}")
             return None
@@ -37,6 +37,11 @@ QLabel {
     color: #ffffff;
 }
 
+/* Data shown from the last session until the first refresh */
+QLabel[stale="true"] {
+    color: #888888;
+}
+
 QFrame {
     background-color: #2d2d2d;
     border-radius: 8px;
@@ -37,6 +37,11 @@ QLabel {
     color: #000000;
 }
 
+/* Data shown from the last session until the first refresh */
+QLabel[stale="true"] {
+    color: #888888;
+}
+
 QFrame {
     background-color: #ffffff;
     border-radius: 8px;
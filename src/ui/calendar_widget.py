@@ -2,8 +2,10 @@
 Calendar widget
 """
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QCalendarWidget, QLabel
-from PyQt5.QtCore import Qt, QDate, QTimer
+from PyQt5.QtCore import Qt, QDate
 from PyQt5.QtGui import QFont
+from src.utils.tick_engine import get_tick_engine, GRANULARITY_DAY
+from src.utils.date_format import MONTH_NAMES, WEEKDAY_NAMES
 
 
 class CalendarWidget(QWidget):
@@ -59,39 +61,24 @@ class CalendarWidget(QWidget):
         """Update the date information label"""
         selected_date = self.calendar.selectedDate()
 
-        # Get day name in English
-        day_names = {
-            1: 'Monday',
-            2: 'Tuesday',
-            3: 'Wednesday',
-            4: 'Thursday',
-            5: 'Friday',
-            6: 'Saturday',
-            7: 'Sunday'
-        }
-
-        # Get month name in English
-        month_names = {
-            1: 'January', 2: 'February', 3: 'March', 4: 'April',
-            5: 'May', 6: 'June', 7: 'July', 8: 'August',
-            9: 'September', 10: 'October', 11: 'November', 12: 'December'
-        }
-
-        day_name = day_names.get(selected_date.dayOfWeek(), '')
-        month_name = month_names.get(selected_date.month(), '')
+        # Get day and month names in English (Qt counts weekdays from Monday = 1)
+        day_name = WEEKDAY_NAMES['en'][selected_date.dayOfWeek() - 1]
+        month_name = MONTH_NAMES['en'][selected_date.month() - 1]
         date_str = f"{month_name} {selected_date.day()}, {selected_date.year()} {day_name}"
 
         self.date_info_label.setText(date_str)
 
     def start_timer(self):
-        """Start the timer to update the calendar date daily"""
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_current_date)
-        # Update every minute (60000 ms) to check if date changed
-        self.timer.start(60000)
-
-    def update_current_date(self):
-        """Update the calendar to show current date if it has changed"""
+        """Follow the shared day tick to update the calendar at midnight"""
+        get_tick_engine().subscribe(self.update_current_date, GRANULARITY_DAY)
+
+    def update_current_date(self, now=None):
+        """
+        Update the calendar to show current date if it has changed
+
+        Args:
+            now: Time of the day tick (unused, the current date is read from Qt)
+        """
         current_date = QDate.currentDate()
         selected_date = self.calendar.selectedDate()
 
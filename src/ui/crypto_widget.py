@@ -1,26 +1,69 @@
 """
 Crypto widget for displaying multiple crypto prices with slide animation
 """
+from datetime import datetime
+from typing import Dict, List, Optional
+
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QStackedWidget
-from PyQt5.QtCore import QTimer, Qt, QPropertyAnimation, QEasingCurve, QPoint, pyqtProperty
+from PyQt5.QtCore import (QTimer, Qt, QPropertyAnimation, QParallelAnimationGroup, QAbstractAnimation,
+                          QEasingCurve, QPoint, pyqtProperty)
 from PyQt5.QtGui import QFont, QCursor
 from src.services.crypto_service import CryptoService
+from src.services.refresh_scheduler import get_refresh_scheduler
+from src.services.data_store import STALE, get_data_store
+from src.services.resilience import CIRCUIT_OPEN
+from src.utils.instrumentation import profiler
+from src.utils.view_binding import ViewBinding
+from src.widgets.crypto_ticker import CryptoTicker
+import config
 
+# Coin fields kept in the data store and app state snapshot, i.e. only what the widget shows
+STATE_COIN_FIELDS = ('symbol', 'name', 'closing_price', 'fluctate_rate', 'volume', 'signals')
 
-class CryptoWidget(QWidget):
-    """Crypto widget that displays multiple crypto prices with slide animation"""
 
-    def __init__(self, parent=None):
+class CryptoWidget(QWidget):
+    """Crypto widget that displays multiple crypto prices with slide animation or as a ticker"""
+
+    def __init__(self, parent=None, coins: Optional[List[str]] = None,
+                 mode: str = config.DEFAULT_CRYPTO_MODE):
+        """
+        Initialize the crypto bar
+
+        Args:
+            parent: Parent widget
+            coins: Coin symbols to show, in order (defaults to config.DEFAULT_CRYPTO_COINS)
+            mode: config.CRYPTO_MODE_CAROUSEL or config.CRYPTO_MODE_TICKER
+        """
         super().__init__(parent)
         self.crypto_service = CryptoService()
 
         # Coin rotation setup
-        self.coins = ['BTC', 'USDT', 'ETH', 'XRP', 'SOL']
+        self.coins = list(coins or config.DEFAULT_CRYPTO_COINS)
         self.current_coin_index = 0
+        self.mode = mode
+        self.suspended = False
+
+        # Last good prices, seeded from the previous run and kept through failed
+        # fetches; this avoids reading the full cached /coins response
+        self.store = get_data_store()
+        self.store.define('market', config.MARKET_STALE_AGE, config.MARKET_MAX_AGE)
+        self.coin_index: Dict[str, Dict] = {}
+        self.binding = ViewBinding('crypto')
+        self.next_coin = None  # (index, view-model) shown by the next rotation
 
         self.init_ui()
+        self.init_animations()
         self.start_timer()
-        self.update_crypto()
+        self.on_data_changed('market')
+        self.set_mode(mode)
+        self.store.changed.connect(self.on_data_changed)
+
+        # The scheduler starts fetching once the event loop runs, so the first frame is not delayed
+        self.scheduler = get_refresh_scheduler()
+        self.scheduler.register(
+            'market', self.crypto_service.get_market_entry, self.on_market_fetched,
+            config.CRYPTO_UPDATE_INTERVAL, on_error=self.on_market_fetch_failed
+        )
 
     def init_ui(self):
         """Initialize the user interface with right-aligned layout"""
@@ -48,6 +91,7 @@ class CryptoWidget(QWidget):
         self.price_label.setStyleSheet("outline: none; border: none;")
         self.price_label.setCursor(QCursor(Qt.PointingHandCursor))
         self.price_label.mousePressEvent = self.mousePressEvent
+        self.price_label.setProperty('stale', False)
 
         # Signal icons - fixed width
         self.signal_label = QLabel("● ● ● ● ●")
@@ -62,6 +106,12 @@ class CryptoWidget(QWidget):
         layout.addWidget(self.price_label)
         layout.addWidget(self.signal_label)
 
+        # Ticker mode shows every coin in one scrolling strip instead of the labels
+        self.ticker = CryptoTicker()
+        self.ticker.setCursor(QCursor(Qt.PointingHandCursor))
+        self.ticker.hide()
+        layout.addWidget(self.ticker)
+
         self.setLayout(layout)
 
         # Set minimum width to prevent widget from shrinking
@@ -74,133 +124,313 @@ class CryptoWidget(QWidget):
             import webbrowser
             webbrowser.open('https://7code.co.kr')
 
+    def init_animations(self):
+        """Create the slide-out and slide-in groups reused by every rotation"""
+        self.rotating_labels = [self.coin_change_label, self.price_label, self.signal_label]
+        self.slide_out_group = QParallelAnimationGroup(self)
+        self.slide_in_group = QParallelAnimationGroup(self)
+        for group in (self.slide_out_group, self.slide_in_group):
+            for label in self.rotating_labels:
+                anim = QPropertyAnimation(label, b"pos", group)
+                anim.setDuration(400)
+                anim.setEasingCurve(QEasingCurve.InOutCubic)
+                group.addAnimation(anim)
+
+        self.slide_out_group.finished.connect(self.switch_coin)
+        # Format the following coin between rotations, not during a slide
+        self.slide_in_group.finished.connect(self.prepare_next_coin)
+
     def start_timer(self):
-        """Start the timer to rotate coins and update crypto info"""
-        # Timer for coin rotation (every 5 seconds)
+        """Create the timer to rotate coins (data refreshes come from the scheduler)"""
+        # Timer for coin rotation (every 5 seconds), started by set_mode()
         self.rotation_timer = QTimer(self)
+        self.rotation_timer.setInterval(5000)  # Rotate every 5 seconds
         self.rotation_timer.timeout.connect(self.rotate_coin)
-        self.rotation_timer.start(5000)  # Rotate every 5 seconds
-
-        # Timer for data refresh (every 30 seconds)
-        self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.refresh_all_data)
-        self.refresh_timer.start(30000)  # Refresh all data every 30 seconds
 
-    def rotate_coin(self):
-        """Rotate to the next coin with slide animation"""
-        # Slide out to the left
-        widget_width = self.width()
+    def set_mode(self, mode: str):
+        """
+        Switch between the one-coin carousel and the scrolling ticker
+
+        Args:
+            mode: config.CRYPTO_MODE_CAROUSEL or config.CRYPTO_MODE_TICKER
+        """
+        self.mode = mode
+        ticker = mode == config.CRYPTO_MODE_TICKER
+        for label in self.rotating_labels:
+            label.setVisible(not ticker)
+        self.ticker.setVisible(ticker)
+        self.render_view()
+        self.update_animation_timers()
+
+    def set_coins(self, coins: List[str]):
+        """
+        Change the coins shown
+
+        Args:
+            coins: Coin symbols, in order
+        """
+        self.coins = list(coins)
+        self.current_coin_index = 0
+        self.render_view()
+        # The stored market only holds the previous coins
+        self.refresh_all_data()
+
+    def update_animation_timers(self):
+        """Run the rotation or the scroll, whichever the mode uses, unless suspended"""
+        if self.suspended or self.mode == config.CRYPTO_MODE_TICKER:
+            self.rotation_timer.stop()
+        elif not self.rotation_timer.isActive():
+            self.rotation_timer.start()
+
+        if not self.suspended and self.mode == config.CRYPTO_MODE_TICKER:
+            self.ticker.start()
+        else:
+            self.ticker.stop()
 
-        # Animate all labels sliding out to left
-        self.slide_out_animations = []
-        for label in [self.coin_change_label, self.price_label, self.signal_label]:
-            anim = QPropertyAnimation(label, b"pos")
-            anim.setDuration(400)
-            anim.setStartValue(label.pos())
-            anim.setEndValue(QPoint(label.pos().x() - widget_width, label.pos().y()))
-            anim.setEasingCurve(QEasingCurve.InOutCubic)
-            self.slide_out_animations.append(anim)
+    def render_view(self):
+        """Show the stored prices in the current mode"""
+        if self.mode == config.CRYPTO_MODE_TICKER:
+            self.update_ticker()
+        else:
+            self.update_crypto()
+            self.prepare_next_coin()
+
+    def suspend(self):
+        """Stop rotating or scrolling while the window is not visible"""
+        self.suspended = True
+        self.update_animation_timers()
+
+    def resume(self):
+        """Show the latest prices and rotate or scroll again"""
+        self.suspended = False
+        self.render_view()
+        self.update_animation_timers()
+
+    def prepare_next_coin(self):
+        """
+        Format the view-model of the next coin with data, ready for the next rotation
+
+        Coins without data are passed over so a coin missing from the
+        market does not stop the rotation.
+        """
+        self.next_coin = None
+        for step in range(1, len(self.coins)):
+            index = (self.current_coin_index + step) % len(self.coins)
+            view = self.coin_view(self.coins[index])
+            if view['has_data']:
+                self.next_coin = (index, view)
+                return
+
+    def set_slide(self, group: QParallelAnimationGroup, distance: int):
+        """Aim every animation of a group from its label's position to distance pixels left of it"""
+        for i, label in enumerate(self.rotating_labels):
+            anim = group.animationAt(i)
+            pos = label.pos()
+            anim.setStartValue(pos)
+            anim.setEndValue(QPoint(pos.x() - distance, pos.y()))
 
-        # Connect last animation to switch coin
-        self.slide_out_animations[-1].finished.connect(self.switch_coin)
+    def rotate_coin(self):
+        """Rotate to the next coin with slide animation, if its data is ready"""
+        if self.next_coin is None:
+            return  # No other coin has data yet
+        if (self.slide_out_group.state() != QAbstractAnimation.Stopped
+                or self.slide_in_group.state() != QAbstractAnimation.Stopped):
+            return
 
-        # Start all animations
-        for anim in self.slide_out_animations:
-            anim.start()
+        # Slide out to the left
+        self.set_slide(self.slide_out_group, self.width())
+        self.slide_out_group.start()
 
     def switch_coin(self):
-        """Switch to next coin and slide in from right"""
-        # Move to next coin
-        self.current_coin_index = (self.current_coin_index + 1) % len(self.coins)
+        """Switch to the prepared coin and slide in from right"""
+        if self.next_coin is None:
+            # The market data expired during the slide; show what is left where it was
+            self.set_slide(self.slide_in_group, -self.width())
+            self.slide_in_group.start()
+            return
+
+        self.current_coin_index, view = self.next_coin
+        self.next_coin = None
 
         widget_width = self.width()
 
         # Position labels off-screen to the right
-        for label in [self.coin_change_label, self.price_label, self.signal_label]:
+        for label in self.rotating_labels:
             current_pos = label.pos()
             label.move(current_pos.x() + widget_width * 2, current_pos.y())
 
-        # Update content
-        self.update_crypto()
+        # Update content from the view-model formatted before the slide
+        self.render_coin(view)
 
         # Slide in from right
-        self.slide_in_animations = []
-        for label in [self.coin_change_label, self.price_label, self.signal_label]:
-            anim = QPropertyAnimation(label, b"pos")
-            anim.setDuration(400)
-            anim.setStartValue(label.pos())
-            anim.setEndValue(QPoint(label.pos().x() - widget_width, label.pos().y()))
-            anim.setEasingCurve(QEasingCurve.InOutCubic)
-            self.slide_in_animations.append(anim)
-
-        # Start all animations
-        for anim in self.slide_in_animations:
-            anim.start()
+        self.set_slide(self.slide_in_group, widget_width)
+        self.slide_in_group.start()
 
     def refresh_all_data(self):
-        """Refresh data for current coin"""
-        self.update_crypto()
+        """Refresh the market snapshot as soon as possible"""
+        self.scheduler.refresh('market')
+
+    def on_market_fetched(self, entry):
+        """Store the refreshed market data on the GUI thread"""
+        snapshot, fetched_at = entry
+        self.store.put('market', self.compact_market(snapshot), fetched_at=fetched_at)
+
+    def on_data_changed(self, name: str):
+        """Index the stored coins and show the current one when the market data changes"""
+        if name != 'market':
+            return
+        coins = self.store.get('market')
+        self.coin_index = self.crypto_service.build_index(coins) if coins else {}
+        self.render_view()
+
+    def compact_market(self, snapshot: Dict[str, Dict]) -> List[Dict]:
+        """
+        Reduce a market snapshot to the rotated coins and the fields shown
+
+        Args:
+            snapshot: Alias index returned by CryptoService.get_market_snapshot()
+
+        Returns:
+            Coin list in /coins format
+        """
+        coins = []
+        for symbol in self.coins:
+            coin = snapshot.get(symbol)
+            if coin:
+                coins.append({field: coin[field] for field in STATE_COIN_FIELDS if field in coin})
+        return coins
+
+    def on_market_fetch_failed(self, error: str):
+        """Keep the last good prices when a fetch fails (the scheduler retries it)"""
+        self.store.fail('market', error)
 
     def update_crypto(self):
-        """Update cryptocurrency information for current coin"""
-        current_symbol = self.coins[self.current_coin_index]
-        coin_data = self.crypto_service.get_coin_data(current_symbol)
-
-        if coin_data:
-            # Get price and change rate
-            price = coin_data.get('closing_price', 0)
-            change_rate = coin_data.get('fluctate_rate', 0)
-            coin_name = coin_data.get('name', current_symbol)
-
-            # Update coin + change rate
-            if change_rate > 0:
-                change_text = f'<span style="color: #00ff00;">(+{change_rate:.2f}%)</span>'
-            elif change_rate < 0:
-                change_text = f'<span style="color: #ff0000;">({change_rate:.2f}%)</span>'
-            else:
-                change_text = f'<span style="color: #888888;">(0.00%)</span>'
-
-            self.coin_change_label.setText(f"{current_symbol} {change_text}")
-
-            # Update price
-            if price > 0:
-                formatted_price = self.crypto_service.format_price(price)
-                self.price_label.setText(formatted_price)
+        """Update cryptocurrency information for current coin from the data store"""
+        view = self.coin_view(self.coins[self.current_coin_index])
+        self.render_coin(view)
+        if view['has_data']:
+            profiler.mark('first_data.crypto')
+
+    def coin_view(self, symbol: str) -> Dict:
+        """
+        Format everything the bar shows for a coin
+
+        Args:
+            symbol: Coin symbol (e.g. 'BTC')
+
+        Returns:
+            View-model with the label texts, tooltip and stale flag
+        """
+        coin_data = self.coin_index.get(symbol)
+        stale = self.store.freshness('market') == STALE
+
+        if not coin_data:
+            status = "Data loading failed" if self.store.error('market') else "Loading prices..."
+            return {
+                'has_data': False,
+                'change': f"{symbol} (--)",
+                'price': "₩--",
+                'signals': '<span style="color: #888888;">● ● ● ● ●</span>',
+                'tooltip': f"{status}\nClick to view more on 7code.co.kr",
+                'stale': stale,
+            }
+
+        # Get price and change rate
+        price = coin_data.get('closing_price', 0)
+        change_rate = coin_data.get('fluctate_rate', 0)
+        coin_name = coin_data.get('name', symbol)
+
+        # Coin + change rate
+        if change_rate > 0:
+            change_text = f'<span style="color: #00ff00;">(+{change_rate:.2f}%)</span>'
+        elif change_rate < 0:
+            change_text = f'<span style="color: #ff0000;">({change_rate:.2f}%)</span>'
+        else:
+            change_text = f'<span style="color: #888888;">(0.00%)</span>'
+
+        # Price
+        formatted_price = self.crypto_service.format_price(price) if price > 0 else "₩--"
+
+        # Signals (if available in data)
+        signals = coin_data.get('signals', [])
+        if signals:
+            signal_icons = self.crypto_service.get_signal_icons(signals)
+        # If no signals field, use change_rate to show trend with colored circles
+        elif change_rate > 2:
+            signal_icons = '<span style="color: #00ff00;">● ● ●</span> <span style="color: #888888;">● ●</span>'
+        elif change_rate > 0:
+            signal_icons = '<span style="color: #00ff00;">● ●</span> <span style="color: #888888;">● ● ●</span>'
+        elif change_rate < -2:
+            signal_icons = '<span style="color: #ff0000;">● ● ●</span> <span style="color: #888888;">● ●</span>'
+        elif change_rate < 0:
+            signal_icons = '<span style="color: #ff0000;">● ●</span> <span style="color: #888888;">● ● ●</span>'
+        else:
+            signal_icons = '<span style="color: #888888;">● ● ● ● ●</span>'
+
+        # Tooltip
+        tooltip = f"{symbol} ({coin_name})\n"
+        tooltip += f"Price: {self.crypto_service.format_price(price)}\n"
+        tooltip += f"Change: {change_rate:+.2f}%\n"
+        if 'volume' in coin_data:
+            volume = coin_data['volume']
+            tooltip += f"Volume: ₩{volume/100000000:.1f}B\n"
+        if stale:
+            fetched_at = self.store.fetched_at('market')
+            if fetched_at:
+                updated = datetime.fromtimestamp(fetched_at).strftime('%Y-%m-%d %H:%M')
+                tooltip += f"\nLast updated {updated}, refreshing...\n"
             else:
-                self.price_label.setText("₩--")
-
-            # Update signals (if available in data)
-            signals = coin_data.get('signals', [])
-            if signals:
-                signal_icons = self.crypto_service.get_signal_icons(signals)
-                self.signal_label.setText(signal_icons)
+                tooltip += "\nLast known prices, refreshing...\n"
+        if self.store.error('market'):
+            status = self.crypto_service.provider_status()
+            if status['state'] == CIRCUIT_OPEN:
+                tooltip += f"Price server not responding, next check in {status['retry_in']:.0f} s\n"
+        tooltip += "\nClick to view more on 7code.co.kr"
+
+        return {
+            'has_data': True,
+            'change': f"{symbol} {change_text}",
+            'price': formatted_price,
+            'signals': signal_icons,
+            'tooltip': tooltip,
+            'stale': stale,
+        }
+
+    def update_ticker(self):
+        """Show every coin with data on the ticker strip"""
+        items = []
+        for symbol in self.coins:
+            coin_data = self.coin_index.get(symbol)
+            if coin_data:
+                price = coin_data.get('closing_price', 0)
+                formatted_price = self.crypto_service.format_price(price) if price > 0 else "₩--"
+                items.append((symbol, formatted_price, coin_data.get('fluctate_rate', 0)))
+
+        stale = self.store.freshness('market') == STALE
+        placeholder = "Data loading failed" if self.store.error('market') else "Loading prices..."
+        self.ticker.set_items(items, stale, placeholder)
+
+        tooltip = "Click to view more on 7code.co.kr"
+        if stale:
+            fetched_at = self.store.fetched_at('market')
+            if fetched_at:
+                updated = datetime.fromtimestamp(fetched_at).strftime('%Y-%m-%d %H:%M')
+                tooltip = f"Last updated {updated}, refreshing...\n" + tooltip
             else:
-                # If no signals field, use change_rate to show trend with colored circles
-                if change_rate > 2:
-                    self.signal_label.setText('<span style="color: #00ff00;">● ● ●</span> <span style="color: #888888;">● ●</span>')
-                elif change_rate > 0:
-                    self.signal_label.setText('<span style="color: #00ff00;">● ●</span> <span style="color: #888888;">● ● ●</span>')
-                elif change_rate < -2:
-                    self.signal_label.setText('<span style="color: #ff0000;">● ● ●</span> <span style="color: #888888;">● ●</span>')
-                elif change_rate < 0:
-                    self.signal_label.setText('<span style="color: #ff0000;">● ●</span> <span style="color: #888888;">● ● ●</span>')
-                else:
-                    self.signal_label.setText('<span style="color: #888888;">● ● ● ● ●</span>')
-                self.signal_label.setStyleSheet("outline: none; border: none;")  # Keep outline/border removed
-
-            # Update tooltip
-            tooltip = f"{current_symbol} ({coin_name})\n"
-            tooltip += f"Price: {self.crypto_service.format_price(price)}\n"
-            tooltip += f"Change: {change_rate:+.2f}%\n"
-            if 'volume' in coin_data:
-                volume = coin_data['volume']
-                tooltip += f"Volume: ₩{volume/100000000:.1f}B\n"
-            tooltip += "\nClick to view more on 7code.co.kr"
-            for label in [self.coin_change_label, self.price_label]:
-                label.setToolTip(tooltip)
-        else:
-            self.coin_change_label.setText(f"{current_symbol} (--)")
-            self.price_label.setText("₩--")
-            self.signal_label.setText('<span style="color: #888888;">● ● ● ● ●</span>')
-            for label in [self.coin_change_label, self.price_label]:
-                label.setToolTip("Data loading failed\nClick to view more on 7code.co.kr")
+                tooltip = "Last known prices, refreshing...\n" + tooltip
+        self.binding.apply([(self.ticker, 'toolTip', tooltip)])
+        if items:
+            profiler.mark('first_data.crypto')
+
+    def render_coin(self, view: Dict):
+        """Apply a coin view-model, touching only the label properties that changed"""
+        self.binding.apply([
+            (self.coin_change_label, 'text', view['change']),
+            (self.coin_change_label, 'toolTip', view['tooltip']),
+            (self.price_label, 'text', view['price']),
+            (self.price_label, 'toolTip', view['tooltip']),
+            (self.price_label, 'stale', view['stale']),
+            (self.signal_label, 'text', view['signals']),
+            # Drops the placeholder grey once real signals are shown
+            (self.signal_label, 'styleSheet', "outline: none; border: none;"),
+        ])
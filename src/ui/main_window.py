@@ -3,8 +3,8 @@ Main window for the Desktop Clock & Weather Application
 """
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QFrame, QSplitter)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt, QEvent
+from PyQt5.QtGui import QIcon, QGuiApplication
 
 from src.widgets.digital_clock import DigitalClock
 from src.widgets.analog_clock import AnalogClock
@@ -14,6 +14,11 @@ from src.ui.crypto_widget import CryptoWidget
 from src.themes.dark_theme import DARK_THEME
 from src.themes.light_theme import LIGHT_THEME
 from src.utils.settings_manager import SettingsManager
+from src.utils.instrumentation import profiler, wakeup_meter
+from src.utils.tick_engine import get_tick_engine
+from src.utils.clock_watch import ClockJumpDetector
+from src.services.refresh_scheduler import get_refresh_scheduler
+from src.utils.date_format import DEFAULT_LANGUAGE
 import config
 
 
@@ -28,8 +33,26 @@ class MainWindow(QMainWindow):
         self.current_theme = self.settings.get('theme', config.DEFAULT_THEME)
         self.clock_mode = self.settings.get('clock.mode', config.DEFAULT_CLOCK_MODE)
 
-        self.init_ui()
-        self.apply_theme()
+        with profiler.phase('init_ui'):
+            self.init_ui()
+        self.settings.watch('clock.sweep_fps', self.on_sweep_fps_changed)
+        self.settings.watch('clock.language', self.on_clock_language_changed)
+        self.settings.watch('crypto.mode', self.crypto_widget.set_mode)
+        self.settings.watch('crypto.coins', self.crypto_widget.set_coins)
+        with profiler.phase('apply_theme'):
+            self.apply_theme()
+
+        # Power management: rendering stops and polling slows while the
+        # window is minimized, hidden, fully covered or the session is locked
+        self.suspended = False
+        self.power_managed = False  # Starts once the window is first on screen
+        self.watching_expose = False
+        QGuiApplication.instance().applicationStateChanged.connect(self.update_power_state)
+
+        # After a suspend or a clock step, re-announce the time and refresh old data
+        self.clock_watch = ClockJumpDetector(self)
+        self.clock_watch.time_jumped.connect(self.on_time_jumped)
+        self.clock_watch.resumed.connect(self.on_resumed)
 
     def init_ui(self):
         """Initialize the user interface"""
@@ -71,8 +94,13 @@ class MainWindow(QMainWindow):
         self.weather_frame.setMaximumHeight(130)  # Limit height for compact display
         weather_layout = QHBoxLayout()
         weather_layout.setContentsMargins(0, 0, 0, 0)
-        self.weather_widget = WeatherWidget()
-        self.crypto_widget = CryptoWidget()
+        with profiler.phase('init_ui.weather_widget'):
+            self.weather_widget = WeatherWidget()
+        with profiler.phase('init_ui.crypto_widget'):
+            self.crypto_widget = CryptoWidget(
+                coins=self.settings.get('crypto.coins', config.DEFAULT_CRYPTO_COINS),
+                mode=self.settings.get('crypto.mode', config.DEFAULT_CRYPTO_MODE)
+            )
         weather_layout.addWidget(self.weather_widget)  # Left aligned
         weather_layout.addStretch()  # Space in the middle
         weather_layout.addWidget(self.crypto_widget)  # Right aligned
@@ -83,21 +111,17 @@ class MainWindow(QMainWindow):
         self.clock_layout = QVBoxLayout()
         self.clock_frame.setLayout(self.clock_layout)
 
-        # Initialize clock based on config
-        self.digital_clock = DigitalClock()
-        self.analog_clock = AnalogClock()
-
-        if self.clock_mode == config.CLOCK_MODE_ANALOG:
-            self.clock_layout.addWidget(self.analog_clock)
-            self.digital_clock.hide()
-        else:
-            self.clock_layout.addWidget(self.digital_clock)
-            self.analog_clock.hide()
+        # Only the clock for the current mode is built; the other one is
+        # created by get_clock_widget() on the first toggle
+        self.digital_clock = None
+        self.analog_clock = None
+        self.clock_layout.addWidget(self.get_clock_widget(self.clock_mode))
 
         # Calendar widget
         self.calendar_frame = QFrame()
         calendar_layout = QVBoxLayout()
-        self.calendar_widget = CalendarWidget()
+        with profiler.phase('init_ui.calendar_widget'):
+            self.calendar_widget = CalendarWidget()
         calendar_layout.addWidget(self.calendar_widget)
         self.calendar_frame.setLayout(calendar_layout)
 
@@ -135,28 +159,59 @@ class MainWindow(QMainWindow):
         self.settings.set('theme', self.current_theme)
         self.apply_theme()
 
+    def get_clock_widget(self, mode: str):
+        """
+        Get the clock widget for a mode, creating it on first use
+
+        Args:
+            mode: config.CLOCK_MODE_ANALOG or config.CLOCK_MODE_DIGITAL
+
+        Returns:
+            The clock widget
+        """
+        if mode == config.CLOCK_MODE_ANALOG:
+            if self.analog_clock is None:
+                with profiler.phase('init_ui.analog_clock'):
+                    self.analog_clock = AnalogClock(
+                        sweep_fps=self.settings.get('clock.sweep_fps', config.DEFAULT_SWEEP_FPS)
+                    )
+            return self.analog_clock
+
+        if self.digital_clock is None:
+            with profiler.phase('init_ui.digital_clock'):
+                self.digital_clock = DigitalClock(
+                    language=self.settings.get('clock.language', DEFAULT_LANGUAGE)
+                )
+        return self.digital_clock
+
+    def on_sweep_fps_changed(self, fps: int):
+        """Apply a changed clock.sweep_fps setting to the analog clock"""
+        if self.analog_clock:
+            self.analog_clock.set_sweep_fps(fps)
+
+    def on_clock_language_changed(self, language: str):
+        """Apply a changed clock.language setting to the digital clock"""
+        if self.digital_clock:
+            self.digital_clock.set_language(language)
+
     def toggle_clock_mode(self):
         """Toggle between digital and analog clock"""
         # Remove current clock widget
-        if self.clock_mode == config.CLOCK_MODE_DIGITAL:
-            self.clock_layout.removeWidget(self.digital_clock)
-            self.digital_clock.hide()
-
-            self.clock_layout.addWidget(self.analog_clock)
-            self.analog_clock.show()
+        current_clock = self.get_clock_widget(self.clock_mode)
+        self.clock_layout.removeWidget(current_clock)
+        current_clock.hide()
 
+        if self.clock_mode == config.CLOCK_MODE_DIGITAL:
             self.clock_mode = config.CLOCK_MODE_ANALOG
             self.clock_mode_button.setText("🕐 Analog")
         else:
-            self.clock_layout.removeWidget(self.analog_clock)
-            self.analog_clock.hide()
-
-            self.clock_layout.addWidget(self.digital_clock)
-            self.digital_clock.show()
-
             self.clock_mode = config.CLOCK_MODE_DIGITAL
             self.clock_mode_button.setText("🔢 Digital")
 
+        new_clock = self.get_clock_widget(self.clock_mode)
+        self.clock_layout.addWidget(new_clock)
+        new_clock.show()
+
         self.settings.set('clock.mode', self.clock_mode)
 
     def apply_theme(self):
@@ -181,3 +236,103 @@ class MainWindow(QMainWindow):
         # Save window size
         self.settings.set('window.width', self.width())
         self.settings.set('window.height', self.height())
+
+    def showEvent(self, event):
+        """Start following expose changes of the native window"""
+        super().showEvent(event)
+        handle = self.windowHandle()
+        if handle is not None and not self.watching_expose:
+            handle.installEventFilter(self)
+            self.watching_expose = True
+
+    def hideEvent(self, event):
+        """Suspend while hidden"""
+        super().hideEvent(event)
+        self.update_power_state()
+
+    def changeEvent(self, event):
+        """Suspend while minimized"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.update_power_state()
+
+    def eventFilter(self, obj, event):
+        """Suspend while the native window is not exposed (e.g. fully covered)"""
+        if event.type() == QEvent.Expose:
+            if obj.isExposed():
+                self.power_managed = True
+            self.update_power_state()
+        return super().eventFilter(obj, event)
+
+    def is_on_screen(self) -> bool:
+        """Check whether any part of the window can currently be seen"""
+        if not self.isVisible() or self.isMinimized():
+            return False
+        handle = self.windowHandle()
+        if handle is not None and not handle.isExposed():
+            return False
+        # Hidden or suspended applications include a locked session on most platforms
+        return QGuiApplication.applicationState() not in (Qt.ApplicationHidden, Qt.ApplicationSuspended)
+
+    def update_power_state(self, *args):
+        """Suspend or resume to match the current visibility"""
+        if not self.power_managed:
+            return  # Not on screen yet
+        self.set_suspended(not self.is_on_screen())
+
+    def set_suspended(self, suspended: bool):
+        """
+        Stop rendering and slow network polling while nothing is on screen
+
+        Args:
+            suspended: True to suspend, False to resume and catch up at once
+        """
+        if suspended == self.suspended:
+            return
+        self.suspended = suspended
+
+        clock = self.get_clock_widget(self.clock_mode)
+        scheduler = get_refresh_scheduler()
+        if suspended:
+            get_tick_engine().suspend()
+            clock.stop_ticking()
+            self.crypto_widget.suspend()
+            scheduler.set_background(True)
+            wakeup_meter.set_state('suspended')
+        else:
+            # Subscribe before resuming so the catch-up tick reaches the clock
+            if clock.isVisible():
+                clock.start_ticking()
+            get_tick_engine().resume()
+            self.crypto_widget.resume()
+            scheduler.set_background(False)
+            wakeup_meter.set_state('visible')
+
+    def on_time_jumped(self, offset: float):
+        """Catch up after the wall clock was stepped"""
+        print(f"Wall clock jumped by {offset:+.1f} s")
+        self.catch_up(max(0.0, offset))
+
+    def on_resumed(self, slept: float):
+        """Catch up after a system suspend"""
+        print(f"Resumed after {slept:.0f} s suspended")
+        self.catch_up(slept)
+
+    def catch_up(self, missed: float):
+        """
+        Show the current time at once and refresh every source that went stale
+
+        Realigning emits the second, minute and day ticks that were crossed,
+        so clocks update and the calendar rolls over immediately. Stale
+        sources are fetched together on the thread pool, fresh ones are left alone.
+
+        Args:
+            missed: Seconds that passed without the monotonic clock counting them
+        """
+        get_tick_engine().realign()
+        get_refresh_scheduler().refresh_stale(int(missed * 1000))
+
+    def closeEvent(self, event):
+        """Write pending settings before the window goes away"""
+        self.settings.flush()
+        super().closeEvent(event)
@@ -1,13 +1,28 @@
 """
 Weather widget
 """
+from datetime import datetime
+from typing import Dict, Optional
+
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-from PyQt5.QtCore import QTimer, Qt, QPropertyAnimation, QEasingCurve, QPoint, pyqtProperty
+from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QPoint, pyqtProperty
 from PyQt5.QtGui import QFont, QCursor
 from src.services.free_weather_service import FreeWeatherService
 from src.services.location_service import LocationService
+from src.services.refresh_scheduler import get_refresh_scheduler
+from src.services.data_store import STALE, get_data_store
+from src.services.resilience import CIRCUIT_OPEN
+from src.utils.instrumentation import profiler
+from src.utils.view_binding import ViewBinding
+from src.utils.app_state import get_app_state
 import config
 
+# Fields kept in the data store and app state snapshot, i.e. only what the widget shows
+READING_FIELDS = {
+    'weather': ('temperature_2m', 'relative_humidity_2m', 'weather_code'),
+    'air_quality': ('pm2_5',),
+}
+
 
 class WeatherWidget(QWidget):
     """Weather widget that displays current weather and air quality"""
@@ -15,13 +30,15 @@ class WeatherWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.weather_service = FreeWeatherService()
+        self.location_service = LocationService()
+        self.app_state = get_app_state()
+        self.scheduler = get_refresh_scheduler()
 
-        # Detect location based on IP
-        self.location = LocationService.detect_location()
-        print(f"Detected location: {self.location['city']}, {self.location['country']}")
+        # Start from the last detected location; detection runs in the background
+        self.location = self.app_state.get('location') or self.location_service.get_cached_location()
 
         # Temperature unit toggle
-        self.current_temp_celsius = 0.0
+        self.current_temp_celsius: Optional[float] = None
         self.is_fahrenheit = False
 
         # Animation objects (keep reference to prevent garbage collection)
@@ -29,9 +46,18 @@ class WeatherWidget(QWidget):
         self.slide_in_anim = None
         self.temp_label_original_pos = None
 
+        # Last good readings, shown (greyed out once stale) while refreshes run or fail
+        self.store = get_data_store()
+        for name in ('weather', 'air_quality'):
+            self.store.define(name, config.WEATHER_STALE_AGE, config.WEATHER_MAX_AGE)
+
+        self.binding = ViewBinding('weather')
         self.init_ui()
-        self.start_timer()
-        self.update_weather()
+        self.seed_from_cache()
+        self.update_weather_display()
+        self.update_air_quality()
+        self.store.changed.connect(self.on_data_changed)
+        self.register_sources()
 
     def init_ui(self):
         """Initialize the user interface"""
@@ -113,70 +139,238 @@ class WeatherWidget(QWidget):
         if self.temp_label_original_pos is None:
             self.temp_label_original_pos = self.temp_label.pos()
 
-    def start_timer(self):
-        """Start the timer to update weather periodically"""
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_weather)
-        self.timer.start(config.WEATHER_UPDATE_INTERVAL)  # Update every 10 minutes
-
-    def update_weather(self):
-        """Update weather information"""
-        # Get weather data using detected location
-        weather_data = self.weather_service.get_weather(
-            lat=self.location['latitude'],
-            lon=self.location['longitude']
+    def register_sources(self):
+        """Register location detection and weather with the refresh scheduler"""
+        # The scheduler starts fetching once the event loop runs, so the first
+        # frame is not delayed; the detected location triggers the first weather fetch
+        self.scheduler.register(
+            'location', self.location_service.detect_location, self.on_location_detected,
+            config.LOCATION_CACHE_TTL, on_error=self.on_location_detection_failed
+        )
+        self.scheduler.register(
+            'weather', self.fetch_weather, self.on_weather_fetched,
+            config.WEATHER_UPDATE_INTERVAL, on_error=self.on_weather_fetch_failed,
+            delay=config.WEATHER_UPDATE_INTERVAL
         )
 
-        if weather_data and 'current' in weather_data:
-            current = weather_data['current']
-
-            # Update temperature
-            temp = current.get('temperature_2m', 0)
-            self.current_temp_celsius = temp
+    def close_services(self):
+        """Stop the services' worker threads so they do not hold up quitting"""
+        self.weather_service.close()
+        self.location_service.close()
 
-            # Display in current unit
-            if self.is_fahrenheit:
-                temp_f = (temp * 9/5) + 32
-                self.temp_label.setText(f"{temp_f:.1f}°F")
-            else:
-                self.temp_label.setText(f"{temp:.1f}°C")
+    def detect_location(self):
+        """Detect the location again, then refresh the weather"""
+        self.scheduler.refresh('location')
 
-            # Update weather icon and description
-            weather_code = current.get('weather_code', 0)
-            icon = self.weather_service.get_weather_icon(weather_code)
-            desc = self.weather_service.get_weather_description(weather_code)
+    def on_location_detected(self, location):
+        """Apply the detected location on the GUI thread"""
+        print(f"Detected location: {location['city']}, {location['country']}")
+        self.app_state.put('location', location)
 
-            self.icon_label.setText(icon)
-            self.desc_label.setText(desc)
+        if location != self.location:
+            self.location = location
+            self.seed_from_cache()
+            self.update_weather_display()
+            self.update_air_quality()
 
-            # Update humidity
-            humidity = current.get('relative_humidity_2m', 0)
-            self.humidity_label.setText(f"Humidity: {humidity}%")
+        self.update_weather()
 
-            # Update location with detected country and city
-            self.country_label.setText(self.location['country'])
-            self.city_label.setText(self.location['city'])
+    def on_location_detection_failed(self, error: str):
+        """Keep the cached location if detection raised unexpectedly"""
+        self.update_weather()
 
-            # Get air quality data
+    def seed_from_cache(self):
+        """Fill in readings the app state snapshot lacks for this location from the HTTP disk cache"""
+        missing = [name for name in ('weather', 'air_quality') if self.readings(name) is None]
+        if not missing:
+            return
+
+        # The snapshot is a few hundred bytes; the HTTP disk cache holds the
+        # full responses and is only read when the snapshot cannot be used
+        latitude = self.location['latitude']
+        longitude = self.location['longitude']
+        snapshot = self.weather_service.get_cached_snapshot(latitude, longitude)
+        if not snapshot:
+            return
+        for name in missing:
+            if snapshot.get(name) is None:
+                continue
+            body, stored_at = snapshot[name]
+            value = self.compact_readings(body, READING_FIELDS[name], latitude, longitude)
+            if value:
+                # Keep the fetch time so the value ages out like a fetched one
+                self.store.seed(name, value, fetched_at=stored_at)
+
+    def readings(self, name: str) -> Optional[Dict]:
+        """
+        Get the current readings of a source if they can be shown for this location
+
+        Args:
+            name: 'weather' or 'air_quality'
+
+        Returns:
+            Dictionary of the 'current' fields, or None if missing, expired or for another location
+        """
+        value = self.store.get(name)
+        if not value or 'current' not in value:
+            return None
+        if (value.get('latitude'), value.get('longitude')) != (self.location['latitude'], self.location['longitude']):
+            return None
+        return value['current']
+
+    @staticmethod
+    def compact_readings(data: Optional[Dict], fields, latitude: float, longitude: float) -> Optional[Dict]:
+        """
+        Reduce an Open-Meteo response to the fields the widget shows
+
+        Args:
+            data: Weather or air quality response
+            fields: Names of the 'current' fields to keep
+            latitude: Latitude the response was fetched for
+            longitude: Longitude the response was fetched for
+
+        Returns:
+            Dictionary with the coordinates and the kept 'current' fields, or None if there is no data
+        """
+        if not data or 'current' not in data:
+            return None
+        current = data['current']
+        return {
+            'latitude': latitude,
+            'longitude': longitude,
+            'current': {field: current[field] for field in fields if field in current}
+        }
+
+    def on_data_changed(self, name: str):
+        """Repaint the readings of a source the data store changed"""
+        if name == 'weather':
+            self.update_weather_display()
+        elif name == 'air_quality':
             self.update_air_quality()
-        else:
-            self.desc_label.setText("No weather data")
 
-    def update_air_quality(self):
-        """Update air quality information"""
-        air_data = self.weather_service.get_air_quality(
-            self.location['latitude'],
-            self.location['longitude']
-        )
+    def freshness_tooltip(self, name: str, what: str) -> str:
+        """
+        Describe how old a source's readings are and why they were not refreshed
+
+        Args:
+            name: Data store source name
+            what: Readable name of the data (e.g. 'weather')
+
+        Returns:
+            Tooltip text, empty while the data is fresh and the last fetch succeeded
+        """
+        lines = []
+        if self.store.freshness(name) == STALE:
+            fetched_at = self.store.fetched_at(name)
+            if fetched_at:
+                updated = datetime.fromtimestamp(fetched_at).strftime('%Y-%m-%d %H:%M')
+                lines.append(f"Last updated {updated}, refreshing...")
+            else:
+                lines.append(f"Last known {what}, refreshing...")
+        if self.store.error(name):
+            status = self.weather_service.provider_status()
+            if status['state'] == CIRCUIT_OPEN:
+                lines.append(f"Weather server not responding, next check in {status['retry_in']:.0f} s")
+        return "\n".join(lines)
 
-        if air_data and 'current' in air_data:
-            current = air_data['current']
-            pm25 = current.get('pm2_5', 0)
-            aqi_desc = self.weather_service.get_pm25_description(pm25)
+    def update_weather(self):
+        """Fetch weather and air quality data as soon as possible"""
+        self.scheduler.refresh('weather')
+
+    def fetch_weather(self) -> Optional[Dict]:
+        """
+        Fetch weather and air quality for the current location (runs on a worker thread)
+
+        Returns:
+            Snapshot tagged with the coordinates it was fetched for, or None if both requests fail
+        """
+        latitude = self.location['latitude']
+        longitude = self.location['longitude']
+        snapshot = self.weather_service.get_snapshot(latitude, longitude)
+        if snapshot is None:
+            return None
+        return dict(snapshot, latitude=latitude, longitude=longitude)
+
+    def on_weather_fetched(self, snapshot):
+        """Store a fetched weather snapshot on the GUI thread; either half may be missing"""
+        latitude = snapshot['latitude']
+        longitude = snapshot['longitude']
+        for name in ('weather', 'air_quality'):
+            body, fetched_at = snapshot.get(name) or (None, None)
+            value = self.compact_readings(body, READING_FIELDS[name], latitude, longitude)
+            if value:
+                # A body served from the disk cache ages from its original fetch
+                self.store.put(name, value, fetched_at=fetched_at)
+            else:
+                self.store.fail(name, f"No {name} data")
 
-            self.air_quality_label.setText(f"PM2.5: {aqi_desc}")
+    def on_weather_fetch_failed(self, error: str):
+        """Keep the last good readings when a fetch fails (the scheduler retries it)"""
+        self.store.fail('weather', error)
+        self.store.fail('air_quality', error)
+
+    def update_weather_display(self):
+        """Show the weather readings from the data store"""
+        current = self.readings('weather')
+        if current:
+            temp = current.get('temperature_2m', 0)
+            weather_code = current.get('weather_code', 0)
+            icon = self.weather_service.get_weather_icon(weather_code)
+            desc = self.weather_service.get_weather_description(weather_code)
+            humidity = f"Humidity: {current.get('relative_humidity_2m', 0)}%"
+            profiler.mark('first_data.weather')
         else:
-            self.air_quality_label.setText("PM2.5: --")
+            # Nothing recent enough to show
+            temp = None
+            icon = "🌡️"
+            desc = "No weather data" if self.store.error('weather') else "Loading weather..."
+            humidity = "Humidity: --%"
+
+        self.current_temp_celsius = temp
+        stale = self.store.freshness('weather') == STALE
+        self.binding.apply([
+            (self.temp_label, 'text', self.format_temperature(temp)),
+            (self.icon_label, 'text', icon),
+            (self.desc_label, 'text', desc),
+            (self.desc_label, 'toolTip', self.freshness_tooltip('weather', 'weather')),
+            (self.humidity_label, 'text', humidity),
+            (self.country_label, 'text', self.location['country']),
+            (self.city_label, 'text', self.location['city']),
+            (self.temp_label, 'stale', stale),
+            (self.desc_label, 'stale', stale),
+            (self.humidity_label, 'stale', stale),
+        ])
+
+    def update_air_quality(self):
+        """Show the air quality readings from the data store"""
+        current = self.readings('air_quality')
+        if current:
+            aqi_desc = self.weather_service.get_pm25_description(current.get('pm2_5', 0))
+            text = f"PM2.5: {aqi_desc}"
+        else:
+            text = "PM2.5: --"
+
+        self.binding.apply([
+            (self.air_quality_label, 'text', text),
+            (self.air_quality_label, 'toolTip', self.freshness_tooltip('air_quality', 'air quality')),
+            (self.air_quality_label, 'stale', self.store.freshness('air_quality') == STALE),
+        ])
+
+    def format_temperature(self, celsius: Optional[float]) -> str:
+        """
+        Format a temperature in the selected unit
+
+        Args:
+            celsius: Temperature in Celsius, or None if unknown
+
+        Returns:
+            Text such as "3.0°C" or "--°F"
+        """
+        unit = "°F" if self.is_fahrenheit else "°C"
+        if celsius is None:
+            return f"--{unit}"
+        value = (celsius * 9/5) + 32 if self.is_fahrenheit else celsius
+        return f"{value:.1f}{unit}"
 
     def toggle_temperature_unit(self, event):
         """Toggle between Celsius and Fahrenheit with rotation animation"""
@@ -204,11 +398,7 @@ class WeatherWidget(QWidget):
         self.is_fahrenheit = not self.is_fahrenheit
 
         # Update text with new unit
-        if self.is_fahrenheit:
-            temp_f = (self.current_temp_celsius * 9/5) + 32
-            self.temp_label.setText(f"{temp_f:.1f}°F")
-        else:
-            self.temp_label.setText(f"{self.current_temp_celsius:.1f}°C")
+        self.binding.apply([(self.temp_label, 'text', self.format_temperature(self.current_temp_celsius))])
 
         # Move label above its normal position (start from top)
         self.temp_label.move(self.temp_label_original_pos.x(), self.temp_label_original_pos.y() - 80)
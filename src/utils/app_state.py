@@ -0,0 +1,180 @@
+"""
+Persisted snapshot of the last data shown, for an instant warm start
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from PyQt5.QtCore import QObject, QTimer
+
+from src.services.fetch_worker import run_in_background
+import config
+
+
+class AppState(QObject):
+    """Last location, weather and market data with the wall-clock time they were fetched"""
+
+    def __init__(self, state_file: str = config.APP_STATE_FILE,
+                 save_delay: int = config.APP_STATE_SAVE_DELAY, parent=None):
+        """
+        Initialize the app state and load the previous snapshot
+
+        Args:
+            state_file: Path to the snapshot JSON file
+            save_delay: Milliseconds to gather updates before writing them
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.state_file = state_file
+        self.entries = self.load()
+
+        # Updates arrive in bursts (weather and air quality, every coin), so
+        # they are written together once the burst is over
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(save_delay)
+        self.save_timer.timeout.connect(self.save_in_background)
+        self.dirty = False
+
+        # Writes may finish out of order; never replace a newer snapshot
+        self.write_lock = threading.Lock()
+        self.generation = 0
+        self.written_generation = 0
+        self.save_worker = None
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the snapshot file
+
+        Returns:
+            Dictionary of section name -> {'saved_at': epoch seconds, 'value': data}
+        """
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Error loading app state: {e}")
+            return {}
+
+        if not isinstance(entries, dict):
+            return {}
+        return {name: entry for name, entry in entries.items()
+                if isinstance(entry, dict) and 'saved_at' in entry and 'value' in entry}
+
+    def get(self, name: str) -> Optional[Any]:
+        """
+        Get the last saved value of a section
+
+        Args:
+            name: Section name (e.g. 'location', 'weather', 'market')
+
+        Returns:
+            Saved value or None
+        """
+        entry = self.entries.get(name)
+        return entry['value'] if entry else None
+
+    def saved_at(self, name: str) -> Optional[float]:
+        """
+        Get when a section was saved
+
+        Args:
+            name: Section name
+
+        Returns:
+            Wall-clock time in epoch seconds or None
+        """
+        entry = self.entries.get(name)
+        return entry['saved_at'] if entry else None
+
+    def put(self, name: str, value: Any, saved_at: Optional[float] = None) -> None:
+        """
+        Replace a section with freshly fetched data
+
+        Args:
+            name: Section name
+            value: JSON-serializable data, kept small (only what is displayed)
+            saved_at: When the data was fetched in epoch seconds (defaults to now)
+        """
+        self.entries[name] = {'saved_at': time.time() if saved_at is None else saved_at, 'value': value}
+        self.dirty = True
+        if not self.save_timer.isActive():
+            self.save_timer.start()
+
+    def serialize(self) -> str:
+        """Serialize all sections compactly and clear the dirty flag"""
+        self.dirty = False
+        self.generation += 1
+        return json.dumps(self.entries, ensure_ascii=False, separators=(',', ':'))
+
+    def save_in_background(self) -> None:
+        """Write pending sections on a worker thread"""
+        if not self.dirty:
+            return
+        self.save_worker = run_in_background(self.write_file, self.serialize(), self.generation)
+
+    def flush(self) -> bool:
+        """
+        Write pending sections now (call on shutdown)
+
+        Returns:
+            True if nothing was pending or the write succeeded
+        """
+        self.save_timer.stop()
+        if not self.dirty:
+            return True
+        return self.write_file(self.serialize(), self.generation)
+
+    def write_file(self, data: str, generation: int) -> bool:
+        """
+        Atomically replace the snapshot file
+
+        Args:
+            data: Serialized sections
+            generation: Serialization counter, older data is dropped
+
+        Returns:
+            True if successful or superseded, False on error
+        """
+        with self.write_lock:
+            if generation <= self.written_generation:
+                return True  # A newer snapshot is already on disk
+
+            state_dir = os.path.dirname(self.state_file) or '.'
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=state_dir, suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.state_file)
+            except OSError as e:
+                print(f"Error saving app state: {e}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return False
+
+            self.written_generation = generation
+            return True
+
+
+_shared_state = None
+
+
+def get_app_state() -> AppState:
+    """
+    Get the application-wide state snapshot, loading it on first use
+
+    Must be called on the GUI thread after the QApplication exists.
+
+    Returns:
+        Shared AppState instance
+    """
+    global _shared_state
+    if _shared_state is None:
+        _shared_state = AppState()
+    return _shared_state
@@ -0,0 +1,79 @@
+"""
+Detection of wall-clock jumps and resumes from system suspend
+"""
+import time
+from typing import Optional
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+import config
+
+
+def boot_time() -> Optional[float]:
+    """
+    Seconds since boot including time spent suspended, where the platform has such a clock
+
+    Returns:
+        CLOCK_BOOTTIME reading (Linux) or None
+    """
+    if hasattr(time, 'CLOCK_BOOTTIME'):
+        return time.clock_gettime(time.CLOCK_BOOTTIME)
+    return None
+
+
+class ClockJumpDetector(QObject):
+    """Compares wall, monotonic and boot clocks at a fixed interval to spot jumps and sleeps"""
+
+    time_jumped = pyqtSignal(float)  # Seconds the wall clock moved beyond the elapsed time
+    resumed = pyqtSignal(float)  # Seconds spent suspended
+
+    def __init__(self, parent=None, interval: int = config.CLOCK_WATCH_INTERVAL,
+                 threshold: int = config.CLOCK_JUMP_THRESHOLD):
+        """
+        Initialize the detector and start watching
+
+        Args:
+            parent: Parent QObject
+            interval: Milliseconds between checks
+            threshold: Discrepancy in milliseconds reported as a jump or resume
+        """
+        super().__init__(parent)
+        self.interval = interval / 1000
+        self.threshold = threshold / 1000
+        self.take_readings()
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check)
+        self.timer.start(interval)
+
+    def take_readings(self) -> None:
+        """Remember the current reading of every clock"""
+        self.last_wall = time.time()
+        self.last_monotonic = time.monotonic()
+        self.last_boot = boot_time()
+
+    def check(self) -> None:
+        """Compare how far each clock moved since the last check and report discrepancies"""
+        wall = time.time() - self.last_wall
+        monotonic = time.monotonic() - self.last_monotonic
+        boot = boot_time()
+        if boot is not None and self.last_boot is not None:
+            # Linux: the monotonic clock stops while suspended but the boot clock
+            # does not. A check delayed by a busy event loop is not a sleep.
+            boot -= self.last_boot
+            slept = boot - monotonic
+        else:
+            # Windows: the monotonic clock keeps running, so only the check
+            # running late gives a suspend away
+            boot = monotonic
+            slept = monotonic - self.interval
+        self.take_readings()
+
+        if slept > self.threshold:
+            self.resumed.emit(slept)
+
+        # An NTP step or manual change moves the wall clock but not the boot clock.
+        # Platforms with neither signal (macOS) report a sleep as a forward jump.
+        offset = wall - boot
+        if abs(offset) > self.threshold:
+            self.time_jumped.emit(offset)
@@ -0,0 +1,63 @@
+"""
+Locale-independent date formatting from precomputed name tables
+"""
+from datetime import date
+
+DEFAULT_LANGUAGE = 'en'
+
+# Month names, January first
+MONTH_NAMES = {
+    'en': ('January', 'February', 'March', 'April', 'May', 'June',
+           'July', 'August', 'September', 'October', 'November', 'December'),
+    'ko': ('1월', '2월', '3월', '4월', '5월', '6월',
+           '7월', '8월', '9월', '10월', '11월', '12월'),
+    'ja': ('1月', '2月', '3月', '4月', '5月', '6月',
+           '7月', '8月', '9月', '10月', '11月', '12月'),
+    'de': ('Januar', 'Februar', 'März', 'April', 'Mai', 'Juni',
+           'Juli', 'August', 'September', 'Oktober', 'November', 'Dezember'),
+    'fr': ('janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+           'juillet', 'août', 'septembre', 'octobre', 'novembre', 'décembre'),
+    'es': ('enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio',
+           'julio', 'agosto', 'septiembre', 'octubre', 'noviembre', 'diciembre'),
+}
+
+# Weekday names, Monday first (matches date.weekday())
+WEEKDAY_NAMES = {
+    'en': ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'),
+    'ko': ('월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일'),
+    'ja': ('月曜日', '火曜日', '水曜日', '木曜日', '金曜日', '土曜日', '日曜日'),
+    'de': ('Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag', 'Samstag', 'Sonntag'),
+    'fr': ('lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi', 'dimanche'),
+    'es': ('lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo'),
+}
+
+# Long date layout per language
+DATE_FORMATS = {
+    'en': '{month} {day:02d}, {year} {weekday}',  # January 15, 2025 Wednesday
+    'ko': '{year}년 {month} {day}일 {weekday}',  # 2025년 1월 15일 수요일
+    'ja': '{year}年{month}{day}日 {weekday}',  # 2025年1月15日 水曜日
+    'de': '{weekday}, {day}. {month} {year}',  # Mittwoch, 15. Januar 2025
+    'fr': '{weekday} {day} {month} {year}',  # mercredi 15 janvier 2025
+    'es': '{weekday}, {day} de {month} de {year}',  # miércoles, 15 de enero de 2025
+}
+
+
+def format_long_date(value: date, language: str = DEFAULT_LANGUAGE) -> str:
+    """
+    Format a date with month and weekday names, independent of the process locale
+
+    Args:
+        value: Date (or datetime) to format
+        language: Language code from MONTH_NAMES, falls back to English
+
+    Returns:
+        Formatted date string
+    """
+    if language not in DATE_FORMATS:
+        language = DEFAULT_LANGUAGE
+    return DATE_FORMATS[language].format(
+        month=MONTH_NAMES[language][value.month - 1],
+        day=value.day,
+        year=value.year,
+        weekday=WEEKDAY_NAMES[language][value.weekday()]
+    )
@@ -0,0 +1,67 @@
+"""
+Font fitting engine that finds the largest point size for a text box
+"""
+from typing import Dict, Tuple
+
+from PyQt5.QtGui import QFont, QFontMetrics
+
+
+class FontFitter:
+    """Finds the largest quantized point size at which a text fits a box"""
+
+    # QFontMetrics shared by all fitters, keyed by (family, weight, point size)
+    metrics_cache: Dict[Tuple[str, int, int], QFontMetrics] = {}
+
+    def __init__(self, family: str, weight: int = QFont.Normal,
+                 min_size: int = 8, max_size: int = 80, step: int = 2):
+        """
+        Initialize the fitter
+
+        Args:
+            family: Font family
+            weight: Font weight (e.g. QFont.Bold)
+            min_size: Smallest point size returned
+            max_size: Largest point size returned
+            step: Distance between candidate point sizes, starting at min_size
+        """
+        self.family = family
+        self.weight = weight
+        self.sizes = list(range(min_size, max_size + 1, step))
+
+    def metrics(self, size: int) -> QFontMetrics:
+        """Get cached font metrics for a point size"""
+        key = (self.family, self.weight, size)
+        metrics = self.metrics_cache.get(key)
+        if metrics is None:
+            metrics = QFontMetrics(QFont(self.family, size, self.weight))
+            self.metrics_cache[key] = metrics
+        return metrics
+
+    def fits(self, text: str, size: int, width: int, height: int) -> bool:
+        """Check whether text at a point size fits inside width x height"""
+        metrics = self.metrics(size)
+        return metrics.horizontalAdvance(text) <= width and metrics.height() <= height
+
+    def fit(self, text: str, width: int, height: int) -> int:
+        """
+        Find the largest quantized point size at which text fits
+
+        Args:
+            text: Text to fit on one line
+            width: Available width in pixels
+            height: Available height in pixels
+
+        Returns:
+            Point size (the smallest size if nothing fits)
+        """
+        # Text width grows monotonically with size, so binary search the buckets
+        low, high = 0, len(self.sizes) - 1
+        best = self.sizes[0]
+        while low <= high:
+            middle = (low + high) // 2
+            if self.fits(text, self.sizes[middle], width, height):
+                best = self.sizes[middle]
+                low = middle + 1
+            else:
+                high = middle - 1
+        return best
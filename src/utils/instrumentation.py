@@ -0,0 +1,317 @@
+"""
+Profilers for measuring where application launch time, idle wakeups and widget updates go
+"""
+import builtins
+import json
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict
+
+
+class StartupProfiler:
+    """Records import, construction and first paint/data timings of a launch"""
+
+    def __init__(self):
+        """Initialize a disabled profiler"""
+        self.enabled = False
+        self.report_file = None
+        self.start_time = time.perf_counter()
+        self.imports = {}
+        self.phases = {}
+        self.marks = {}
+        self.original_import = None
+
+    def enable(self, report_file: str) -> None:
+        """
+        Start profiling and time every module imported from now on
+
+        Args:
+            report_file: Path of the JSON report
+        """
+        self.enabled = True
+        self.report_file = report_file
+        self.original_import = builtins.__import__
+        builtins.__import__ = self.timed_import
+
+    def timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """builtins.__import__ replacement recording first-time absolute imports"""
+        if level or name in sys.modules:
+            return self.original_import(name, globals, locals, fromlist, level)
+
+        start = time.perf_counter()
+        try:
+            return self.original_import(name, globals, locals, fromlist, level)
+        finally:
+            # Inclusive of the modules it pulls in
+            self.imports.setdefault(name, self.elapsed_ms(start))
+
+    def stop_import_timing(self) -> None:
+        """Restore the original import function"""
+        if self.original_import is not None:
+            builtins.__import__ = self.original_import
+            self.original_import = None
+
+    @staticmethod
+    def elapsed_ms(start: float) -> float:
+        """Milliseconds since a perf_counter() value"""
+        return round((time.perf_counter() - start) * 1000, 3)
+
+    def phase(self, name: str):
+        """
+        Context manager timing one startup phase
+
+        Args:
+            name: Phase name (e.g. 'init_ui.weather_widget')
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self.timed_phase(name)
+
+    @contextmanager
+    def timed_phase(self, name: str):
+        """Record the duration of the wrapped block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.elapsed_ms(start)
+
+    def mark(self, name: str) -> None:
+        """
+        Record the first time a milestone is reached
+
+        Args:
+            name: Milestone name (e.g. 'first_paint', 'first_data.weather')
+        """
+        if not self.enabled or name in self.marks:
+            return
+        self.marks[name] = self.elapsed_ms(self.start_time)
+        if 'first_paint' in self.marks:
+            self.write_report()
+
+    def watch_first_paint(self, widget) -> None:
+        """
+        Mark 'first_paint' when the widget receives its first paint event
+
+        Args:
+            widget: Top-level window to watch
+        """
+        if not self.enabled:
+            return
+
+        from PyQt5.QtCore import QEvent, QObject
+
+        profiler = self
+
+        class FirstPaintFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint:
+                    obj.removeEventFilter(self)
+                    profiler.stop_import_timing()
+                    profiler.mark('first_paint')
+                return False
+
+        self.paint_filter = FirstPaintFilter(widget)
+        widget.installEventFilter(self.paint_filter)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build the profile report
+
+        Returns:
+            Dictionary with import, phase and milestone timings in milliseconds
+        """
+        return {
+            'imports_ms': dict(sorted(self.imports.items(), key=lambda item: -item[1])),
+            'phases_ms': self.phases,
+            'marks_ms': self.marks,
+            'time_to_first_paint_ms': self.marks.get('first_paint'),
+            'time_to_first_data_ms': min(
+                (value for key, value in self.marks.items() if key.startswith('first_data.')),
+                default=None
+            )
+        }
+
+    def write_report(self) -> None:
+        """Write the report to the configured JSON file"""
+        if not self.enabled:
+            return
+        try:
+            with open(self.report_file, 'w', encoding='utf-8') as f:
+                json.dump(self.report(), f, indent=2)
+        except OSError as e:
+            print(f"Error writing startup profile: {e}")
+
+
+class WakeupMeter:
+    """Counts GUI thread wakeups (timer events and queued calls) per power state"""
+
+    def __init__(self):
+        """Initialize a disabled meter"""
+        self.enabled = False
+        self.report_file = None
+        self.state = 'visible'
+        self.state_start = time.perf_counter()
+        self.wakeups = {}  # State -> wakeup count
+        self.seconds = {}  # State -> seconds spent in it
+
+    def enable(self, app, report_file: str) -> None:
+        """
+        Start counting every timer event and queued call the application dispatches
+
+        Args:
+            app: QApplication to watch
+            report_file: Path of the JSON report
+        """
+        from PyQt5.QtCore import QEvent, QObject
+
+        meter = self
+        counted = (QEvent.Timer, QEvent.MetaCall)
+
+        class WakeupFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() in counted:
+                    meter.wakeups[meter.state] = meter.wakeups.get(meter.state, 0) + 1
+                return False
+
+        self.enabled = True
+        self.report_file = report_file
+        self.state_start = time.perf_counter()
+        self.event_filter = WakeupFilter(app)
+        app.installEventFilter(self.event_filter)
+
+    def set_state(self, state: str) -> None:
+        """
+        Start attributing wakeups to another state and log the rate of the previous one
+
+        Args:
+            state: State name (e.g. 'visible', 'suspended')
+        """
+        if not self.enabled or state == self.state:
+            return
+        self.close_state()
+        print(f"Wakeups/s while {self.state}: {self.rate(self.state):.1f}")
+        self.state = state
+
+    def close_state(self) -> None:
+        """Add the time spent in the current state to its total"""
+        now = time.perf_counter()
+        self.seconds[self.state] = self.seconds.get(self.state, 0.0) + now - self.state_start
+        self.state_start = now
+
+    def rate(self, state: str) -> float:
+        """Average wakeups per second in a state"""
+        seconds = self.seconds.get(state, 0.0)
+        return self.wakeups.get(state, 0) / seconds if seconds else 0.0
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build the wakeup report
+
+        Returns:
+            Dictionary of state -> wakeups, seconds and wakeups per second
+        """
+        self.close_state()
+        return {
+            state: {
+                'wakeups': self.wakeups.get(state, 0),
+                'seconds': round(seconds, 3),
+                'per_second': round(self.rate(state), 2)
+            }
+            for state, seconds in self.seconds.items()
+        }
+
+    def write_report(self) -> None:
+        """Write the report to the configured JSON file"""
+        if not self.enabled:
+            return
+        try:
+            with open(self.report_file, 'w', encoding='utf-8') as f:
+                json.dump(self.report(), f, indent=2)
+        except OSError as e:
+            print(f"Error writing wakeup profile: {e}")
+
+
+class ViewUpdateCounter:
+    """Counts widget properties applied vs. skipped as unchanged, per view"""
+
+    def __init__(self):
+        """Initialize the counter; counting is always on, reporting is opt-in"""
+        self.report_file = None
+        self.applied = {}  # View name -> properties set on widgets
+        self.skipped = {}  # View name -> properties left alone because they did not change
+
+    def enable(self, report_file: str) -> None:
+        """
+        Write the counts to a JSON report on write_report()
+
+        Args:
+            report_file: Path of the JSON report
+        """
+        self.report_file = report_file
+
+    def count(self, view: str, applied: int, skipped: int) -> None:
+        """
+        Add the outcome of one view update
+
+        Args:
+            view: View name (e.g. 'weather', 'crypto')
+            applied: Properties set on widgets
+            skipped: Properties left unchanged
+        """
+        self.applied[view] = self.applied.get(view, 0) + applied
+        self.skipped[view] = self.skipped.get(view, 0) + skipped
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build the update report
+
+        Returns:
+            Dictionary of view -> applied, skipped and skipped fraction
+        """
+        report = {}
+        for view in self.applied:
+            applied = self.applied[view]
+            skipped = self.skipped.get(view, 0)
+            total = applied + skipped
+            report[view] = {
+                'applied': applied,
+                'skipped': skipped,
+                'skipped_ratio': round(skipped / total, 3) if total else 0.0
+            }
+        return report
+
+    def write_report(self) -> None:
+        """Write the report to the configured JSON file"""
+        if self.report_file is None:
+            return
+        try:
+            with open(self.report_file, 'w', encoding='utf-8') as f:
+                json.dump(self.report(), f, indent=2)
+        except OSError as e:
+            print(f"Error writing view update profile: {e}")
+
+
+def frame_cost_us(widget, step, frames: int) -> float:
+    """
+    Measure the average cost of one animation frame
+
+    Args:
+        widget: Shown widget to repaint synchronously after each step
+        step: Callable advancing the animation by one frame, given the frame number
+        frames: Frames to average over
+
+    Returns:
+        Mean microseconds per frame (step plus repaint)
+    """
+    start = time.perf_counter()
+    for frame in range(frames):
+        step(frame)
+        widget.repaint()
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+profiler = StartupProfiler()
+wakeup_meter = WakeupMeter()
+view_updates = ViewUpdateCounter()
@@ -3,54 +3,201 @@ Settings manager for saving and loading user preferences
 """
 import json
 import os
-from typing import Any, Dict
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List
 
+from PyQt5.QtCore import QObject, pyqtSignal
 
-class SettingsManager:
+import config
+from src.utils.date_format import DATE_FORMATS
+from src.utils.settings_schema import SettingsSchema
+
+# Extra checks beyond the value type taken from the defaults
+VALIDATORS = {
+    'window.width': lambda value: value > 0,
+    'window.height': lambda value: value > 0,
+    'theme': lambda value: value in (config.THEME_DARK, config.THEME_LIGHT),
+    'clock.mode': lambda value: value in (config.CLOCK_MODE_DIGITAL, config.CLOCK_MODE_ANALOG),
+    'clock.scale': lambda value: value > 0,
+    'clock.sweep_fps': lambda value: value == 0 or value in config.SWEEP_FPS_LEVELS,
+    'clock.language': lambda value: value in DATE_FORMATS,
+    'splitter.sizes': lambda value: (len(value) == 2 and
+                                     all(type(size) is int and size >= 0 for size in value)),
+    'crypto.mode': lambda value: value in (config.CRYPTO_MODE_CAROUSEL, config.CRYPTO_MODE_TICKER),
+    'crypto.coins': lambda value: (0 < len(value) <= config.CRYPTO_MAX_COINS and
+                                   all(type(symbol) is str and symbol for symbol in value)),
+    'location.latitude': lambda value: -90 <= value <= 90,
+    'location.longitude': lambda value: -180 <= value <= 180,
+}
+
+
+class SettingsManager(QObject):
     """Manages user settings persistence"""
 
-    def __init__(self, settings_file: str = "user_settings.json"):
+    # Emitted with (dotted key, new value) whenever set() changes a value
+    value_changed = pyqtSignal(str, object)
+
+    def __init__(self, settings_file: str = "user_settings.json",
+                 save_delay: int = config.SETTINGS_SAVE_DELAY, parent=None):
         """
         Initialize settings manager
 
         Args:
             settings_file: Path to settings JSON file
+            save_delay: Quiet period in milliseconds before changes are written
+            parent: Parent QObject
         """
+        super().__init__(parent)
         self.settings_file = settings_file
-        self.settings = self.load_settings()
+        self.save_delay = save_delay / 1000
+
+        # Defaults are merged and validated once here; afterwards every known
+        # key resolves to its (section, attribute) without walking dicts
+        self.schema = SettingsSchema(self.get_default_settings(), VALIDATORS)
+        self.values, self.extra = self.schema.load(self.load_settings())
+        self.accessors = self.schema.bind(self.values)
+        self.watchers: Dict[str, List[Callable[[Any], None]]] = {}
+
+        # Write-behind state: set() marks the settings dirty and a background
+        # writer saves them once no change has arrived for save_delay
+        self.condition = threading.Condition()
+        self.write_lock = threading.Lock()  # Keeps writes in order
+        self.dirty = False
+        self.last_change = 0.0
+        self.closed = False
+        self.write_count = 0
+        self.writer = threading.Thread(target=self.writer_loop,
+                                       name='SettingsWriter', daemon=True)
+        self.writer.start()
 
     def load_settings(self) -> Dict[str, Any]:
         """
         Load settings from JSON file
 
         Returns:
-            Dictionary of settings
+            Dictionary of settings as stored (missing keys are filled from the defaults later)
         """
         if os.path.exists(self.settings_file):
             try:
                 with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    return data
+                print("Error loading settings: not a JSON object")
             except Exception as e:
                 print(f"Error loading settings: {e}")
-                return self.get_default_settings()
-        else:
-            return self.get_default_settings()
+        return {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get all settings as plain nested dictionaries
+
+        Returns:
+            Dictionary of settings, including keys unknown to the schema
+        """
+        with self.condition:
+            return self.schema.dump(self.values, self.extra)
 
     def save_settings(self) -> bool:
         """
-        Save current settings to JSON file
+        Save current settings to JSON file immediately
 
         Returns:
             True if successful, False otherwise
         """
+        with self.condition:
+            self.dirty = True
+        return self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write pending changes now instead of waiting for the quiet period
+
+        Returns:
+            True if nothing was pending or the write succeeded, False otherwise
+        """
+        with self.write_lock:
+            with self.condition:
+                if not self.dirty:
+                    return True
+                data = json.dumps(self.schema.dump(self.values, self.extra),
+                                  indent=2, ensure_ascii=False)
+                self.dirty = False
+
+            if self.write_file(data):
+                return True
+
+            # Keep the changes pending so a later flush retries them
+            with self.condition:
+                self.dirty = True
+            return False
+
+    def write_file(self, data: str) -> bool:
+        """
+        Atomically replace the settings file
+
+        The data goes to a temporary file in the same directory which is then
+        renamed over the settings file, so a crash never leaves it half written.
+
+        Args:
+            data: Serialized settings
+
+        Returns:
+            True if successful, False otherwise
+        """
+        settings_dir = os.path.dirname(self.settings_file) or '.'
+        tmp_path = None
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            fd, tmp_path = tempfile.mkstemp(dir=settings_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.settings_file)
+            self.write_count += 1
             return True
-        except Exception as e:
+        except OSError as e:
             print(f"Error saving settings: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return False
 
+    def writer_loop(self) -> None:
+        """Background writer: save dirty settings after a quiet period"""
+        while True:
+            with self.condition:
+                while not self.dirty and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return  # close() flushes on the caller's thread
+
+                # Every set() pushes the deadline back, coalescing bursts
+                while self.dirty and not self.closed:
+                    remaining = self.last_change + self.save_delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                if self.closed:
+                    return
+
+            self.flush()
+
+    def close(self) -> bool:
+        """
+        Stop the background writer and write any pending changes
+
+        Call on shutdown; later set() calls are still kept in memory
+        but only saved by an explicit flush().
+
+        Returns:
+            True if the final write succeeded or nothing was pending
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.writer.join()
+        return self.flush()
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a setting value
@@ -62,8 +209,14 @@ class SettingsManager:
         Returns:
             Setting value or default
         """
+        accessor = self.accessors.get(key)
+        if accessor is not None:
+            owner, attr = accessor
+            return getattr(owner, attr)
+
+        # Whole sections and keys outside the schema fall back to a dict walk
         keys = key.split('.')
-        value = self.settings
+        value = self.to_dict()
 
         for k in keys:
             if isinstance(value, dict) and k in value:
@@ -77,20 +230,74 @@ class SettingsManager:
         """
         Set a setting value
 
+        The change is written to disk in the background after a quiet period
+        of save_delay; call flush() to write it right away.
+
         Args:
             key: Setting key (supports dot notation like 'window.width')
             value: Value to set
         """
-        keys = key.split('.')
-        current = self.settings
+        if key in self.schema.sections:
+            print(f"Error setting {key}: set its individual values instead")
+            return
+        if key in self.schema.leaf_types:
+            try:
+                value = self.schema.validate(key, value)
+            except ValueError as e:
+                print(f"Error setting {e}")
+                return
+
+        # The writer thread serializes the settings under the same lock
+        with self.condition:
+            accessor = self.accessors.get(key)
+            if accessor is not None:
+                owner, attr = accessor
+                if getattr(owner, attr) == value:
+                    return  # Unchanged, nothing to write
+                setattr(owner, attr, value)
+            else:
+                keys = key.split('.')
+                current = self.extra
+                for k in keys[:-1]:
+                    if not isinstance(current.get(k), dict):
+                        current[k] = {}
+                    current = current[k]
+
+                if keys[-1] in current and current[keys[-1]] == value:
+                    return  # Unchanged, nothing to write
+                current[keys[-1]] = value
 
-        for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            current = current[k]
+            self.dirty = True
+            self.last_change = time.monotonic()
+            self.condition.notify_all()
 
-        current[keys[-1]] = value
-        self.save_settings()
+        self.value_changed.emit(key, value)
+        for callback in self.watchers.get(key, ()):
+            callback(value)
+
+    def watch(self, key: str, callback: Callable[[Any], None]) -> None:
+        """
+        Call back whenever a setting changes
+
+        Callbacks run on the thread that called set().
+
+        Args:
+            key: Setting key (supports dot notation like 'window.width')
+            callback: Called with the new value
+        """
+        self.watchers.setdefault(key, []).append(callback)
+
+    def unwatch(self, key: str, callback: Callable[[Any], None]) -> None:
+        """
+        Stop calling back a previously watched key
+
+        Args:
+            key: Setting key passed to watch()
+            callback: Callback passed to watch()
+        """
+        callbacks = self.watchers.get(key, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
 
     @staticmethod
     def get_default_settings() -> Dict[str, Any]:
@@ -106,9 +313,18 @@ class SettingsManager:
                 "height": 900
             },
             "theme": "dark",
+            "splitter": {
+                "sizes": [500, 500]
+            },
             "clock": {
                 "mode": "analog",
-                "scale": 1.0
+                "scale": 1.0,
+                "sweep_fps": 0,
+                "language": "en"
+            },
+            "crypto": {
+                "mode": "carousel",
+                "coins": ["BTC", "USDT", "ETH", "XRP", "SOL"]
             },
             "location": {
                 "city": "Seoul",
@@ -0,0 +1,173 @@
+"""
+Typed settings schema generated from the default settings
+"""
+import copy
+from dataclasses import asdict, field, make_dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def make_settings_class(name: str, defaults: Dict[str, Any]) -> type:
+    """
+    Build a slotted dataclass whose fields mirror a defaults dict
+
+    Nested dicts become nested dataclasses; every other value's type
+    becomes the field type and the value its default.
+
+    Args:
+        name: Class name
+        defaults: Default settings for this section
+
+    Returns:
+        Dataclass type
+    """
+    specs = []
+    for key, value in defaults.items():
+        if isinstance(value, dict):
+            section_type = make_settings_class(f"{key.title().replace('_', '')}Settings", value)
+            specs.append((key, section_type, field(default_factory=section_type)))
+        else:
+            specs.append((key, type(value),
+                          field(default_factory=lambda value=value: copy.deepcopy(value))))
+    return make_dataclass(name, specs, slots=True)
+
+
+def merge_dicts(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """Recursively copy source into target, keeping target keys source lacks"""
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge_dicts(target[key], value)
+        else:
+            target[key] = value
+
+
+class SettingsSchema:
+    """Typed settings layout with dotted keys compiled once"""
+
+    def __init__(self, defaults: Dict[str, Any],
+                 validators: Optional[Dict[str, Callable[[Any], bool]]] = None):
+        """
+        Initialize the schema
+
+        Args:
+            defaults: Default settings; their layout and value types define the schema
+            validators: Extra checks per dotted key, returning False for invalid values
+        """
+        self.root_type = make_settings_class('Settings', defaults)
+        self.validators = validators or {}
+        self.leaf_types: Dict[str, type] = {}  # Dotted key -> value type
+        self.sections = set()  # Dotted keys of nested sections
+        self.compile(defaults, ())
+
+    def compile(self, defaults: Dict[str, Any], prefix: Tuple[str, ...]) -> None:
+        """Record the dotted key of every section and value under a prefix"""
+        for key, value in defaults.items():
+            path = prefix + (key,)
+            if isinstance(value, dict):
+                self.sections.add('.'.join(path))
+                self.compile(value, path)
+            else:
+                self.leaf_types['.'.join(path)] = type(value)
+
+    def validate(self, key: str, value: Any) -> Any:
+        """
+        Check a value against its key's type and validator
+
+        Args:
+            key: Dotted key of a schema value
+            value: Candidate value
+
+        Returns:
+            The value, with ints widened to float for float keys
+
+        Raises:
+            ValueError: If the value has the wrong type or fails the validator
+        """
+        expected = self.leaf_types[key]
+        if expected is float and type(value) is int:
+            value = float(value)
+        # Exact type match, so True is not accepted as an int
+        if type(value) is not expected:
+            raise ValueError(f"{key} must be {expected.__name__}, got {value!r}")
+
+        check = self.validators.get(key)
+        if check is not None and not check(value):
+            raise ValueError(f"{key} has invalid value {value!r}")
+        return value
+
+    def load(self, data: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Merge raw settings over the defaults
+
+        Invalid values fall back to their defaults. Keys the schema does not
+        know are returned separately so they survive the next save.
+
+        Args:
+            data: Settings as read from JSON
+
+        Returns:
+            Tuple of (settings dataclass instance, dict of unknown keys)
+        """
+        root = self.root_type()
+        extra: Dict[str, Any] = {}
+        self.merge(root, data, (), extra)
+        return root, extra
+
+    def merge(self, section: Any, data: Dict[str, Any], prefix: Tuple[str, ...],
+              extra: Dict[str, Any]) -> None:
+        """Copy valid values from data into a section, collecting unknown keys in extra"""
+        for key, value in data.items():
+            path = prefix + (key,)
+            dotted = '.'.join(path)
+            if dotted in self.sections:
+                if not isinstance(value, dict):
+                    print(f"Ignoring setting {dotted}: expected a section, got {value!r}")
+                    continue
+                unknown: Dict[str, Any] = {}
+                self.merge(getattr(section, key), value, path, unknown)
+                if unknown:
+                    extra[key] = unknown
+            elif dotted in self.leaf_types:
+                try:
+                    setattr(section, key, self.validate(dotted, value))
+                except ValueError as e:
+                    print(f"Ignoring setting {e}")
+            else:
+                extra[key] = value
+
+    def bind(self, root: Any) -> Dict[str, Tuple[Any, str]]:
+        """
+        Resolve the dotted key of every value to the section holding it
+
+        Sections are never replaced, so the result stays valid for the
+        lifetime of root and each lookup is a single getattr.
+
+        Args:
+            root: Settings dataclass instance
+
+        Returns:
+            Dictionary of dotted key -> (owning section, attribute name)
+        """
+        accessors = {}
+        for dotted in self.leaf_types:
+            *parents, attr = dotted.split('.')
+            owner = root
+            for parent in parents:
+                owner = getattr(owner, parent)
+            accessors[dotted] = (owner, attr)
+        return accessors
+
+    @staticmethod
+    def dump(root: Any, extra: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert settings back to plain JSON-ready dicts
+
+        Args:
+            root: Settings dataclass instance
+            extra: Unknown keys returned by load()
+
+        Returns:
+            Nested dictionary of all settings
+        """
+        data = asdict(root)
+        merge_dicts(data, copy.deepcopy(extra))
+        return data
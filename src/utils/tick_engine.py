@@ -0,0 +1,152 @@
+"""
+Wall-clock aligned tick source shared by every clock widget
+"""
+import math
+from datetime import datetime, timedelta
+
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+GRANULARITY_SECOND = 'second'
+GRANULARITY_MINUTE = 'minute'
+GRANULARITY_DAY = 'day'
+
+# Fire this long after the boundary so the wall clock has surely passed it
+TICK_SLACK_MS = 2
+
+
+class TickEngine(QObject):
+    """Single-shot timer re-armed for the next second, minute or day boundary"""
+
+    tick = pyqtSignal(object)
+    minute_tick = pyqtSignal(object)
+    day_tick = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.signals = {
+            GRANULARITY_SECOND: self.tick,
+            GRANULARITY_MINUTE: self.minute_tick,
+            GRANULARITY_DAY: self.day_tick
+        }
+        self.subscribers = {granularity: 0 for granularity in self.signals}
+        self.suspended = False
+
+        # Boundaries already announced, so an early or repeated wakeup emits nothing
+        now = datetime.now()
+        self.last_second = now.replace(microsecond=0)
+        self.last_minute = self.last_second.replace(second=0)
+        self.last_day = now.date()
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.on_timeout)
+
+    def subscribe(self, callback, granularity: str = GRANULARITY_SECOND) -> None:
+        """
+        Call back on every boundary of the given granularity
+
+        Args:
+            callback: Slot receiving the current datetime
+            granularity: GRANULARITY_SECOND, GRANULARITY_MINUTE or GRANULARITY_DAY
+        """
+        self.signals[granularity].connect(callback)
+        self.subscribers[granularity] += 1
+        self.schedule()
+
+    def unsubscribe(self, callback, granularity: str = GRANULARITY_SECOND) -> None:
+        """
+        Stop calling back a previously subscribed slot
+
+        Args:
+            callback: Slot passed to subscribe()
+            granularity: Granularity it was subscribed with
+        """
+        try:
+            self.signals[granularity].disconnect(callback)
+        except TypeError:
+            return  # Not connected
+        self.subscribers[granularity] -= 1
+        self.schedule()
+
+    def finest_granularity(self):
+        """Finest granularity anyone is subscribed to, or None"""
+        for granularity in (GRANULARITY_SECOND, GRANULARITY_MINUTE, GRANULARITY_DAY):
+            if self.subscribers[granularity] > 0:
+                return granularity
+        return None
+
+    @staticmethod
+    def next_boundary(now: datetime, granularity: str) -> datetime:
+        """Next wall-clock boundary of a granularity after now"""
+        if granularity == GRANULARITY_SECOND:
+            return now.replace(microsecond=0) + timedelta(seconds=1)
+        if granularity == GRANULARITY_MINUTE:
+            return now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        return now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+    def schedule(self) -> None:
+        """Arm the timer for the next boundary anyone is subscribed to"""
+        granularity = self.finest_granularity()
+        if granularity is None or self.suspended:
+            self.timer.stop()
+            return
+
+        now = datetime.now()
+        delay = (self.next_boundary(now, granularity) - now).total_seconds() * 1000
+        self.timer.start(int(math.ceil(delay)) + TICK_SLACK_MS)
+
+    def on_timeout(self) -> None:
+        """Announce the boundaries that were crossed and re-align to the next one"""
+        self.emit_ticks(datetime.now())
+        self.schedule()
+
+    def emit_ticks(self, now: datetime) -> None:
+        """Emit each signal whose boundary changed since it was last emitted"""
+        second = now.replace(microsecond=0)
+        if second != self.last_second:
+            self.last_second = second
+            self.tick.emit(now)
+
+        minute = second.replace(second=0)
+        if minute != self.last_minute:
+            self.last_minute = minute
+            self.minute_tick.emit(now)
+
+        day = now.date()
+        if day != self.last_day:
+            self.last_day = day
+            self.day_tick.emit(now)
+
+    def realign(self) -> None:
+        """Re-announce the current time at once and re-arm (e.g. after a clock jump)"""
+        self.emit_ticks(datetime.now())
+        self.schedule()
+
+    def suspend(self) -> None:
+        """Stop ticking while nothing is on screen; subscriptions are kept"""
+        self.suspended = True
+        self.timer.stop()
+
+    def resume(self) -> None:
+        """Tick again, announcing every boundary crossed while suspended at once"""
+        self.suspended = False
+        self.realign()
+
+
+_shared_engine = None
+
+
+def get_tick_engine() -> TickEngine:
+    """
+    Get the application-wide tick engine, creating it on first use
+
+    Must be called on the GUI thread after the QApplication exists.
+
+    Returns:
+        Shared TickEngine instance
+    """
+    global _shared_engine
+    if _shared_engine is None:
+        _shared_engine = TickEngine()
+    return _shared_engine
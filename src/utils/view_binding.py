@@ -0,0 +1,78 @@
+"""
+Diff-based application of view-models to widgets
+"""
+from typing import Any, Dict, Iterable, Tuple
+
+from src.utils.instrumentation import view_updates
+
+# View-model properties set through a widget method; any other name is a
+# dynamic property that stylesheet selectors match on (e.g. QLabel[stale="true"])
+SETTERS = {
+    'text': 'setText',
+    'toolTip': 'setToolTip',
+    'styleSheet': 'setStyleSheet',
+}
+
+
+def set_widget_property(widget, name: str, value: Any) -> None:
+    """
+    Set one view-model property on a widget
+
+    Args:
+        widget: Target widget
+        name: Property name ('text', 'toolTip', 'styleSheet' or a dynamic property)
+        value: New value
+    """
+    setter = SETTERS.get(name)
+    if setter is not None:
+        getattr(widget, setter)(value)
+        return
+
+    widget.setProperty(name, value)
+    # Re-evaluate stylesheet rules that select on the property
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+class ViewBinding:
+    """
+    Remembers what a view last rendered and touches only the properties that changed
+
+    Every setText, setToolTip, setStyleSheet or re-polish can invalidate
+    the label's size hint and relayout its parent, so a refresh that
+    produces the same view-model should not call any of them.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize an empty binding
+
+        Args:
+            name: View name for the update counters (e.g. 'weather')
+        """
+        self.name = name
+        self.rendered: Dict[Tuple[Any, str], Any] = {}  # (widget, property) -> value
+
+    def apply(self, updates: Iterable[Tuple[Any, str, Any]]) -> int:
+        """
+        Apply a view-model, skipping properties whose value did not change
+
+        Args:
+            updates: (widget, property name, value) triples
+
+        Returns:
+            Number of properties applied
+        """
+        applied = skipped = 0
+        for widget, name, value in updates:
+            key = (widget, name)
+            if key in self.rendered and self.rendered[key] == value:
+                skipped += 1
+                continue
+            self.rendered[key] = value
+            set_widget_property(widget, name, value)
+            applied += 1
+
+        view_updates.count(self.name, applied, skipped)
+        return applied
+
@@ -2,57 +2,353 @@
 Analog clock widget
 """
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtCore import QTimer, QTime, Qt, QPoint
-from PyQt5.QtGui import QPainter, QColor, QPen, QPolygon, QFont
+from PyQt5.QtCore import QTimer, QTime, Qt, QPoint, QEvent, QRect, QPointF
+from PyQt5.QtGui import QPainter, QColor, QPen, QPolygon, QFont, QPixmap, QFontMetrics, QRegion
+from datetime import datetime
 import math
+import os
+import time
+import config
+from src.utils.tick_engine import get_tick_engine
+
+
+def _hand_table(steps: int, length: int):
+    """Precompute hand end points for `steps` evenly spaced positions from 12 o'clock"""
+    table = []
+    for i in range(steps):
+        angle = math.radians(i * 360.0 / steps - 90)
+        table.append((int(length * math.cos(angle)), int(length * math.sin(angle))))
+    return table
+
+
+def _marker_table(count: int, inner: int, outer: int, skip_every: int = 0):
+    """Precompute dial marker lines, optionally skipping every n-th position"""
+    lines = []
+    for i in range(count):
+        if skip_every and i % skip_every == 0:
+            continue
+        angle = math.radians(i * 360.0 / count - 90)
+        lines.append((int(inner * math.cos(angle)), int(inner * math.sin(angle)),
+                      int(outer * math.cos(angle)), int(outer * math.sin(angle))))
+    return lines
+
+
+# Dial geometry in the 250x250 logical clock space
+HOUR_MARKERS = _marker_table(12, 85, 95)
+MINUTE_MARKERS = _marker_table(60, 90, 95, skip_every=5)
+
+# Hand end points indexed by minutes since 12:00 (hour hand, 0.5 degree steps),
+# seconds since the full hour (minute hand, 0.1 degree steps) and seconds
+HOUR_HAND_POINTS = _hand_table(12 * 60, 50)
+MINUTE_HAND_POINTS = _hand_table(60 * 60, 70)
+SECOND_HAND_POINTS = _hand_table(60, 80)
+
+# Pen widths of the hour, minute and second hands and the center dot radius
+HAND_PEN_WIDTHS = (6, 4, 2)
+CENTER_DOT_RADIUS = 6
+
+# Frames averaged before the sweep frame rate is adjusted
+SWEEP_SAMPLE_FRAMES = 30
 
 
 class AnalogClock(QWidget):
     """Analog clock widget that displays time with clock hands"""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, sweep_fps: int = config.DEFAULT_SWEEP_FPS):
         super().__init__(parent)
         self.scale = 1.0
         self.base_size = 200
         self.setMinimumSize(150, 150)
+        self.time_font = QFont('Ubuntu', 10)
+
+        # Pre-rendered dial, rebuilt when size, pixel ratio or theme changes
+        self.dial_cache = None
+        self.dial_cache_key = None
+
+        # Smooth sweep: requested frame rate and the rate currently affordable
+        self.sweep_fps = sweep_fps
+        self.current_fps = sweep_fps
+        self.paint_times = []
+
+        # Top-level window whose expose events start and stop the sweep timer
+        self.watched_window = None
+
+        # Time to show in the next paint and the region of the hands on screen
+        self.display_time = datetime.now()
+        self.hands_region = None
+
+        # Tint every repainted region to visualize partial updates
+        self.debug_repaint = bool(os.environ.get(config.DEBUG_REPAINT_ENV))
+        self.debug_paint_count = 0
+
         self.start_timer()
 
     def start_timer(self):
-        """Start the timer to update the clock"""
+        """Start updating the clock"""
+        # Sweep frames come from a private timer; ticks from the shared tick engine
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update)
-        self.timer.start(1000)  # Update every second
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.advance)
+        self.ticking = False
+        self.start_ticking()
 
-    def paintEvent(self, event):
-        """Paint the analog clock"""
-        from datetime import datetime
+    def start_ticking(self):
+        """Start the frame timer or follow the shared second tick"""
+        if self.ticking:
+            return
+        self.ticking = True
+        if self.current_fps:
+            self.update_sweep_timer()
+        else:
+            get_tick_engine().subscribe(self.advance)
+
+    def stop_ticking(self):
+        """Stop all updates"""
+        if not self.ticking:
+            return
+        self.ticking = False
+        self.timer.stop()
+        get_tick_engine().unsubscribe(self.advance)
+
+    def set_sweep_fps(self, fps: int):
+        """
+        Switch between ticking once per second (0) and a smooth sweep
+
+        Args:
+            fps: Frames per second for the sweep, or 0 to tick
+        """
+        self.sweep_fps = fps
+        self.set_current_fps(fps)
 
-        current_time = datetime.now()
+    def set_current_fps(self, fps: int):
+        """Apply a frame rate without changing the requested one"""
+        was_ticking = self.ticking
+        self.stop_ticking()
+        self.current_fps = fps
+        self.paint_times = []
+        if was_ticking:
+            self.start_ticking()
+
+    def is_exposed(self) -> bool:
+        """Check whether the top-level window is actually on screen"""
+        handle = self.window().windowHandle()
+        return handle is None or handle.isExposed()
+
+    def update_sweep_timer(self):
+        """Run the sweep timer only while sweeping in a window that is on screen"""
+        if self.ticking and self.current_fps and self.is_exposed():
+            if not self.timer.isActive():
+                self.timer.start(1000 // self.current_fps)
+                self.advance()
+        else:
+            self.timer.stop()
+
+    def watch_window(self):
+        """Follow expose events of the current top-level window"""
+        handle = self.window().windowHandle()
+        if handle is self.watched_window:
+            return
+        if self.watched_window is not None:
+            self.watched_window.removeEventFilter(self)
+        self.watched_window = handle
+        if handle is not None:
+            handle.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """Stop the sweep while the window is minimized or covered, resume when exposed"""
+        if obj is self.watched_window and event.type() == QEvent.Expose:
+            self.update_sweep_timer()
+        return super().eventFilter(obj, event)
+
+    def advance(self, current_time=None):
+        """
+        Move to the current time and repaint only what changed
+
+        Args:
+            current_time: Time to show (defaults to now)
+        """
+        previous_time = self.display_time
+        self.display_time = current_time or datetime.now()
+
+        # Old and new hand positions, plus the digital time when its text changed
+        region = self.get_hands_region(self.display_time)
+        if self.hands_region is not None:
+            region = region.united(self.hands_region)
+        if previous_time.replace(microsecond=0) != self.display_time.replace(microsecond=0):
+            region = region.united(QRegion(self.text_rect()))
+
+        self.update(region)
+
+    def record_paint_time(self, elapsed_ms: float):
+        """
+        Track sweep paint cost and step the frame rate down when over budget
+
+        Also sampled while a sweep has fallen back to ticking, so it can
+        step back up once painting is cheap again.
+
+        Args:
+            elapsed_ms: Time spent in the last paintEvent
+        """
+        self.paint_times.append(elapsed_ms)
+        if len(self.paint_times) < SWEEP_SAMPLE_FRAMES:
+            return
+
+        average = sum(self.paint_times) / len(self.paint_times)
+        self.paint_times = []
+        levels = [fps for fps in config.SWEEP_FPS_LEVELS if fps <= self.sweep_fps]
+        if average > config.SWEEP_PAINT_BUDGET_MS:
+            if not self.current_fps:
+                return  # Already ticking
+            lower = [fps for fps in levels if fps < self.current_fps]
+            # Out of sweep levels: fall back to ticking once per second
+            self.set_current_fps(lower[0] if lower else 0)
+        elif average < config.SWEEP_PAINT_BUDGET_MS / 4:
+            higher = [fps for fps in levels if fps > self.current_fps]
+            if higher:
+                self.set_current_fps(higher[-1])
+
+    def hand_points(self, current_time: datetime):
+        """
+        End points of the hour, minute and second hands in clock space
+
+        Args:
+            current_time: Time to show
+
+        Returns:
+            Tuple of three (x, y) end points
+        """
         hour = current_time.hour % 12
         minute = current_time.minute
         second = current_time.second
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        if self.current_fps:
+            # Sweep: continuous angles including the fraction of the second
+            seconds = second + current_time.microsecond / 1000000
+            return (self.hand_point((hour * 30 + minute * 0.5 + seconds / 120), 50),
+                    self.hand_point((minute * 6 + seconds * 0.1), 70),
+                    self.hand_point(seconds * 6, 80))
 
-        # Get the widget size
+        return (HOUR_HAND_POINTS[hour * 60 + minute],
+                MINUTE_HAND_POINTS[minute * 60 + second],
+                SECOND_HAND_POINTS[second])
+
+    def clock_geometry(self):
+        """
+        Placement of the clock space inside the widget
+
+        Returns:
+            Tuple of (side, center x, center y, widget pixels per clock unit)
+        """
         side = min(self.width(), self.height())
-        painter.translate(self.width() / 2, self.height() / 2)
-        painter.scale(side / 250.0, side / 250.0)
+        center_x = (self.width() - side) // 2 + side / 2
+        center_y = (self.height() - side) // 2 + side / 2
+        return side, center_x, center_y, side / 250.0
+
+    def get_hands_region(self, current_time: datetime) -> QRegion:
+        """
+        Widget-space region covered by the hands and center dot
+
+        Args:
+            current_time: Time whose hand positions are covered
+
+        Returns:
+            Union of one bounding rectangle per hand
+        """
+        _, center_x, center_y, unit = self.clock_geometry()
+        region = QRegion()
+
+        for (x, y), pen_width in zip(self.hand_points(current_time), HAND_PEN_WIDTHS):
+            # Round caps extend half a pen width past both ends; +2 covers antialiasing
+            margin = pen_width * unit / 2 + 2
+            left = center_x + min(0, x) * unit - margin
+            top = center_y + min(0, y) * unit - margin
+            right = center_x + max(0, x) * unit + margin
+            bottom = center_y + max(0, y) * unit + margin
+            region = region.united(QRegion(int(left), int(top),
+                                           int(math.ceil(right - left)) + 1,
+                                           int(math.ceil(bottom - top)) + 1))
+
+        dot = int(math.ceil(CENTER_DOT_RADIUS * unit)) + 2
+        return region.united(QRegion(int(center_x) - dot, int(center_y) - dot, dot * 2 + 1, dot * 2 + 1))
+
+    def text_rect(self) -> QRect:
+        """Widget-space rectangle containing the digital time below the clock"""
+        side = min(self.width(), self.height())
+        fm = QFontMetrics(self.time_font)
+        clock_bottom = int((self.height() / 2) + (side / 2) + 30)
+        text_width = fm.horizontalAdvance('00:00:00') + 8
+        return QRect(int(self.width() / 2 - text_width / 2), clock_bottom - fm.ascent() - 2,
+                     text_width, fm.height() + 4)
+
+    def showEvent(self, event):
+        """Resume ticking when the clock becomes visible"""
+        super().showEvent(event)
+        self.watch_window()
+        if not self.ticking:
+            # Give a hidden sweep another chance at the requested frame rate
+            self.current_fps = self.sweep_fps
+            self.paint_times = []
+            self.display_time = datetime.now()
+            self.start_ticking()
+
+    def hideEvent(self, event):
+        """Stop ticking while the clock is hidden"""
+        super().hideEvent(event)
+        self.stop_ticking()
 
-        # Determine colors based on theme
-        # We'll use a simple check of the background to determine if it's dark or light
+    def resizeEvent(self, event):
+        """Drop the dial cache so it is re-rendered at the new size"""
+        super().resizeEvent(event)
+        self.dial_cache = None
+
+    def changeEvent(self, event):
+        """Drop the dial cache when the theme (palette or stylesheet) changes"""
+        super().changeEvent(event)
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            self.dial_cache = None
+
+    def theme_colors(self):
+        """
+        Determine colors based on theme
+
+        We use a simple check of the background to determine if it's dark or light
+
+        Returns:
+            Tuple of (is_dark, clock color, hand color, second hand color)
+        """
         bg_color = self.palette().window().color()
         is_dark = bg_color.lightness() < 128
 
         if is_dark:
-            clock_color = QColor(255, 255, 255)
-            hand_color = QColor(255, 255, 255)
-            second_hand_color = QColor(255, 100, 100)
-        else:
-            clock_color = QColor(0, 0, 0)
-            hand_color = QColor(0, 0, 0)
-            second_hand_color = QColor(200, 50, 50)
+            return is_dark, QColor(255, 255, 255), QColor(255, 255, 255), QColor(255, 100, 100)
+        return is_dark, QColor(0, 0, 0), QColor(0, 0, 0), QColor(200, 50, 50)
+
+    def get_dial(self, side: int, is_dark: bool, clock_color: QColor) -> QPixmap:
+        """
+        Get the static clock face, rendering it only when its key changes
+
+        Args:
+            side: Edge length of the square clock area in pixels
+            is_dark: Whether the dark theme is active
+            clock_color: Color of the border and markers
+
+        Returns:
+            Pixmap of the clock face covering the square clock area
+        """
+        dpr = self.devicePixelRatioF()
+        key = (side, dpr, is_dark, clock_color.rgba())
+        if self.dial_cache is not None and self.dial_cache_key == key:
+            return self.dial_cache
+
+        dial = QPixmap(int(side * dpr), int(side * dpr))
+        dial.setDevicePixelRatio(dpr)
+        # Transparent so the frame behind the clock shows around and inside the face
+        dial.fill(Qt.transparent)
+
+        painter = QPainter(dial)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(side / 2, side / 2)
+        painter.scale(side / 250.0, side / 250.0)
 
         # Draw clock face border
         painter.setPen(QPen(clock_color, 3))
@@ -60,45 +356,55 @@ class AnalogClock(QWidget):
 
         # Draw hour markers
         painter.setPen(QPen(clock_color, 2))
-        for i in range(12):
-            angle = math.radians(i * 30 - 90)
-            x1 = int(85 * math.cos(angle))
-            y1 = int(85 * math.sin(angle))
-            x2 = int(95 * math.cos(angle))
-            y2 = int(95 * math.sin(angle))
+        for x1, y1, x2, y2 in HOUR_MARKERS:
             painter.drawLine(x1, y1, x2, y2)
 
         # Draw minute markers
         painter.setPen(QPen(clock_color, 1))
-        for i in range(60):
-            if i % 5 != 0:  # Skip hour markers
-                angle = math.radians(i * 6 - 90)
-                x1 = int(90 * math.cos(angle))
-                y1 = int(90 * math.sin(angle))
-                x2 = int(95 * math.cos(angle))
-                y2 = int(95 * math.sin(angle))
-                painter.drawLine(x1, y1, x2, y2)
+        for x1, y1, x2, y2 in MINUTE_MARKERS:
+            painter.drawLine(x1, y1, x2, y2)
+
+        painter.end()
+
+        self.dial_cache = dial
+        self.dial_cache_key = key
+        return dial
+
+    def paintEvent(self, event):
+        """Paint the analog clock"""
+        paint_start = time.perf_counter()
+        # Paint the time advance() computed the dirty region for
+        current_time = self.display_time
+
+        painter = QPainter(self)
+
+        # Get the widget size
+        side, center_x, center_y, unit = self.clock_geometry()
+        is_dark, clock_color, hand_color, second_hand_color = self.theme_colors()
+
+        # Blit the cached face, then draw only the moving parts
+        painter.drawPixmap((self.width() - side) // 2, (self.height() - side) // 2,
+                           self.get_dial(side, is_dark, clock_color))
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(center_x, center_y)
+        painter.scale(unit, unit)
+
+        hour_point, minute_point, second_point = self.hand_points(current_time)
+        # Remember where the hands are so the next frame can erase them
+        self.hands_region = self.get_hands_region(current_time)
 
         # Draw hour hand
-        hour_angle = math.radians((hour * 30 + minute * 0.5) - 90)
-        hour_x = int(50 * math.cos(hour_angle))
-        hour_y = int(50 * math.sin(hour_angle))
         painter.setPen(QPen(hand_color, 6, Qt.SolidLine, Qt.RoundCap))
-        painter.drawLine(0, 0, hour_x, hour_y)
+        painter.drawLine(QPointF(0, 0), QPointF(*hour_point))
 
         # Draw minute hand
-        minute_angle = math.radians((minute * 6 + second * 0.1) - 90)
-        minute_x = int(70 * math.cos(minute_angle))
-        minute_y = int(70 * math.sin(minute_angle))
         painter.setPen(QPen(hand_color, 4, Qt.SolidLine, Qt.RoundCap))
-        painter.drawLine(0, 0, minute_x, minute_y)
+        painter.drawLine(QPointF(0, 0), QPointF(*minute_point))
 
         # Draw second hand
-        second_angle = math.radians(second * 6 - 90)
-        second_x = int(80 * math.cos(second_angle))
-        second_y = int(80 * math.sin(second_angle))
         painter.setPen(QPen(second_hand_color, 2, Qt.SolidLine, Qt.RoundCap))
-        painter.drawLine(0, 0, second_x, second_y)
+        painter.drawLine(QPointF(0, 0), QPointF(*second_point))
 
         # Draw center dot
         painter.setPen(QPen(hand_color, 1))
@@ -110,8 +416,7 @@ class AnalogClock(QWidget):
 
         # Draw digital time below the clock (centered)
         painter.setPen(QPen(clock_color, 1))
-        font = QFont('Ubuntu', 10)
-        painter.setFont(font)
+        painter.setFont(self.time_font)
         time_str = current_time.strftime('%H:%M:%S')
 
         # Calculate text width for centering
@@ -125,6 +430,28 @@ class AnalogClock(QWidget):
         # Draw text centered horizontally, below the clock
         painter.drawText(int(self.width() / 2 - text_width / 2), int(clock_bottom), time_str)
 
+        if self.debug_repaint:
+            self.paint_debug_overlay(painter, event.region())
+        painter.end()
+
+        if self.sweep_fps:
+            self.record_paint_time((time.perf_counter() - paint_start) * 1000)
+
+    def paint_debug_overlay(self, painter: QPainter, region: QRegion):
+        """Tint the repainted region with a color that changes every paint"""
+        self.debug_paint_count += 1
+        color = QColor.fromHsv((self.debug_paint_count * 47) % 360, 255, 255, 70)
+        painter.setPen(QPen(color.darker(), 1))
+        painter.setBrush(color)
+        for rect in region.rects():
+            painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
+    @staticmethod
+    def hand_point(degrees: float, length: int):
+        """End point of a hand at an angle measured clockwise from 12 o'clock"""
+        angle = math.radians(degrees - 90)
+        return length * math.cos(angle), length * math.sin(angle)
+
     def set_scale(self, scale):
         """Set the scale factor for the clock"""
         self.scale = scale
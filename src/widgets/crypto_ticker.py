@@ -0,0 +1,209 @@
+"""
+Continuously scrolling crypto ticker rendered from a cached strip
+"""
+import time
+from typing import List, Tuple
+
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import QTimer, Qt, QEvent, QRectF
+from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetrics, QPixmap
+import config
+
+# Space between two coins on the strip, in pixels
+ITEM_GAP = 36
+# Space between the symbol, price and change of one coin
+FIELD_GAP = 8
+
+UP_COLOR = QColor('#00ff00')
+DOWN_COLOR = QColor('#ff0000')
+FLAT_COLOR = QColor('#888888')
+
+
+class CryptoTicker(QWidget):
+    """
+    Scrolls every watched coin past in one strip
+
+    All coins are drawn once into a pixmap that is re-rendered only when a
+    price, the size or the theme changes; a frame copies the visible slice
+    at the current offset, so its cost does not grow with the number of coins.
+    """
+
+    def __init__(self, parent=None, speed: int = config.CRYPTO_TICKER_SPEED,
+                 fps: int = config.CRYPTO_TICKER_FPS):
+        """
+        Initialize an empty, stopped ticker
+
+        Args:
+            parent: Parent widget
+            speed: Scroll speed in pixels per second
+            fps: Frames per second while scrolling
+        """
+        super().__init__(parent)
+        self.speed = speed
+        self.symbol_font = QFont('Ubuntu', 10, QFont.Bold)
+        self.price_font = QFont('Ubuntu Mono', 10)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+
+        # (symbol, formatted price, change rate) per coin, plus the stale flag
+        self.items: List[Tuple[str, str, float]] = []
+        self.stale = False
+        self.placeholder = ""
+
+        # Pre-rendered strip, rebuilt when its key changes
+        self.strip = None
+        self.strip_key = None
+        self.strip_width = 0  # Logical pixels
+
+        # Scroll position into the strip in pixels
+        self.offset = 0.0
+        self.last_step = None
+        self.running = False
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(max(1, 1000 // fps))
+        self.timer.timeout.connect(self.advance)
+
+    def set_items(self, items: List[Tuple[str, str, float]], stale: bool = False,
+                  placeholder: str = "") -> None:
+        """
+        Replace the coins shown, re-rendering the strip only if something changed
+
+        Args:
+            items: (symbol, formatted price, change rate in percent) per coin
+            stale: Grey out the prices
+            placeholder: Text shown instead of the strip while there are no items
+        """
+        if (items, stale, placeholder) == (self.items, self.stale, self.placeholder):
+            return
+        self.items = list(items)
+        self.stale = stale
+        self.placeholder = placeholder
+        self.strip = None
+        self.update_timer()
+        self.update()
+
+    def start(self) -> None:
+        """Start scrolling"""
+        self.running = True
+        self.update_timer()
+
+    def stop(self) -> None:
+        """Stop scrolling (e.g. while hidden)"""
+        self.running = False
+        self.update_timer()
+
+    def update_timer(self) -> None:
+        """Run the frame timer only while scrolling something"""
+        if self.running and self.items:
+            if not self.timer.isActive():
+                self.last_step = None
+                self.timer.start()
+        else:
+            self.timer.stop()
+
+    def advance(self) -> None:
+        """Move the strip by the distance covered since the last frame"""
+        now = time.monotonic()
+        elapsed = self.timer.interval() / 1000 if self.last_step is None else now - self.last_step
+        self.last_step = now
+        self.offset += self.speed * elapsed
+        self.update()
+
+    def resizeEvent(self, event):
+        """Drop the strip so it is re-rendered at the new height"""
+        super().resizeEvent(event)
+        self.strip = None
+
+    def changeEvent(self, event):
+        """Drop the strip when the theme (palette or stylesheet) changes"""
+        super().changeEvent(event)
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange):
+            self.strip = None
+
+    def get_strip(self) -> QPixmap:
+        """
+        Get the strip of all coins, rendering it only when its key changes
+
+        Returns:
+            Pixmap as high as the widget, ending with a gap so it tiles seamlessly
+        """
+        dpr = self.devicePixelRatioF()
+        text_color = self.palette().windowText().color()
+        key = (self.height(), dpr, text_color.rgba())
+        if self.strip is not None and self.strip_key == key:
+            return self.strip
+
+        symbol_metrics = QFontMetrics(self.symbol_font)
+        price_metrics = QFontMetrics(self.price_font)
+
+        # Lay out every coin first to size the pixmap
+        fields = []
+        width = 0
+        for symbol, price, change_rate in self.items:
+            change = f"{change_rate:+.2f}%"
+            if change_rate > 0:
+                change_color = UP_COLOR
+            elif change_rate < 0:
+                change_color = DOWN_COLOR
+            else:
+                change_color = FLAT_COLOR
+            widths = (symbol_metrics.horizontalAdvance(symbol),
+                      price_metrics.horizontalAdvance(price),
+                      price_metrics.horizontalAdvance(change))
+            fields.append((width, symbol, price, change, change_color, widths))
+            width += sum(widths) + 2 * FIELD_GAP + ITEM_GAP
+
+        height = self.height()
+        strip = QPixmap(max(1, int(width * dpr)), max(1, int(height * dpr)))
+        strip.setDevicePixelRatio(dpr)
+        # Transparent so the frame behind the ticker shows between the coins
+        strip.fill(Qt.transparent)
+
+        painter = QPainter(strip)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        price_color = FLAT_COLOR if self.stale else text_color
+        baseline = (height + symbol_metrics.ascent() - symbol_metrics.descent()) // 2
+        for x, symbol, price, change, change_color, widths in fields:
+            painter.setFont(self.symbol_font)
+            painter.setPen(text_color)
+            painter.drawText(x, baseline, symbol)
+            x += widths[0] + FIELD_GAP
+
+            painter.setFont(self.price_font)
+            painter.setPen(price_color)
+            painter.drawText(x, baseline, price)
+            x += widths[1] + FIELD_GAP
+
+            painter.setPen(change_color)
+            painter.drawText(x, baseline, change)
+        painter.end()
+
+        self.strip = strip
+        self.strip_key = key
+        self.strip_width = width
+        return strip
+
+    def paintEvent(self, event):
+        """Blit the visible part of the strip at the scroll offset, repeating it to fill the width"""
+        painter = QPainter(self)
+        if not self.items:
+            painter.setFont(self.price_font)
+            painter.setPen(FLAT_COLOR)
+            painter.drawText(self.rect(), Qt.AlignLeft | Qt.AlignVCenter, self.placeholder)
+            return
+
+        strip = self.get_strip()
+        dpr = strip.devicePixelRatioF()
+        height = self.height()
+        self.offset %= self.strip_width
+
+        # Copy only the visible slice, wrapping to the strip start at its end
+        x = 0
+        source_x = int(self.offset)
+        while x < self.width():
+            width = min(self.strip_width - source_x, self.width() - x)
+            painter.drawPixmap(QRectF(x, 0, width, height), strip,
+                               QRectF(source_x * dpr, 0, width * dpr, height * dpr))
+            x += width
+            source_x = 0
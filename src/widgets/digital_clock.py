@@ -1,19 +1,44 @@
 """
 Digital clock widget
 """
-from PyQt5.QtWidgets import QLabel, QVBoxLayout, QWidget
+from PyQt5.QtWidgets import QLabel, QSizePolicy, QVBoxLayout, QWidget
 from PyQt5.QtCore import QTimer, QTime, Qt
 from PyQt5.QtGui import QFont
+from src.utils.tick_engine import get_tick_engine
+from src.utils.date_format import format_long_date, DEFAULT_LANGUAGE
+from src.utils.font_fit import FontFitter
+
+# Coalesce resize bursts into one font fit per frame
+FONT_FIT_DELAY_MS = 16
+# Fraction of the width the text may fill, leaving slack while a shrink is pending
+FONT_FIT_WIDTH = 0.9
 
 
 class DigitalClock(QWidget):
     """Digital clock widget that displays time in digital format"""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, language: str = DEFAULT_LANGUAGE):
         super().__init__(parent)
+        self.language = language
+        # Last rendered label contents
+        self.time_text = None
+        self.shown_date = None
         self.scale = 1.0
         self.base_time_font_size = 32
         self.base_date_font_size = 16
+
+        # Fonts scale between 0.6x and 2.5x of the base sizes
+        self.time_fitter = FontFitter('Ubuntu Mono', QFont.Bold,
+                                      int(self.base_time_font_size * 0.6),
+                                      int(self.base_time_font_size * 2.5))
+        self.date_fitter = FontFitter('Ubuntu', QFont.Normal,
+                                      int(self.base_date_font_size * 0.6),
+                                      int(self.base_date_font_size * 2.5))
+        self.fit_timer = QTimer(self)
+        self.fit_timer.setSingleShot(True)
+        self.fit_timer.setInterval(FONT_FIT_DELAY_MS)
+        self.fit_timer.timeout.connect(self.apply_font_fit)
+
         self.init_ui()
         self.start_timer()
 
@@ -30,6 +55,9 @@ class DigitalClock(QWidget):
         self.time_label.setStyleSheet("outline: none; border: none;")
         self.time_font = QFont('Ubuntu Mono', self.base_time_font_size, QFont.Bold)
         self.time_label.setFont(self.time_font)
+        # The fitted text must not set a minimum width, or the splitter
+        # could never shrink the pane below the current font size
+        self.time_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
 
         # Date label
         self.date_label = QLabel()
@@ -38,6 +66,7 @@ class DigitalClock(QWidget):
         self.date_label.setStyleSheet("outline: none; border: none;")
         self.date_font = QFont('Ubuntu', self.base_date_font_size)
         self.date_label.setFont(self.date_font)
+        self.date_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
 
         layout.addStretch(5)
         layout.addWidget(self.time_label, 5)
@@ -48,59 +77,119 @@ class DigitalClock(QWidget):
         self.update_time()
 
     def start_timer(self):
-        """Start the timer to update the clock"""
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_time)
-        self.timer.start(1000)  # Update every second
-
-    def update_time(self):
-        """Update the displayed time"""
+        """Subscribe to the shared second tick to update the clock"""
+        self.ticking = False
+        self.start_ticking()
+
+    def start_ticking(self):
+        """Follow the shared second tick"""
+        if not self.ticking:
+            self.ticking = True
+            get_tick_engine().subscribe(self.update_time)
+
+    def stop_ticking(self):
+        """Stop following the shared second tick"""
+        if self.ticking:
+            self.ticking = False
+            get_tick_engine().unsubscribe(self.update_time)
+
+    def showEvent(self, event):
+        """Resume ticking when the clock becomes visible"""
+        super().showEvent(event)
+        if not self.ticking:
+            self.update_time()
+            self.start_ticking()
+
+    def hideEvent(self, event):
+        """Stop ticking while the clock is hidden"""
+        super().hideEvent(event)
+        self.stop_ticking()
+
+    def update_time(self, current_time=None):
+        """
+        Update the displayed time
+
+        Labels are only touched when their text changes; the date is
+        recomputed once per day.
+
+        Args:
+            current_time: Time to show (defaults to now)
+        """
         from datetime import datetime
-        import locale
 
-        current_time = datetime.now()
+        if current_time is None:
+            current_time = datetime.now()
 
         # Format time as HH:MM:SS
-        time_str = current_time.strftime('%H:%M:%S')
-        self.time_label.setText(time_str)
-
-        # Format date in English (e.g., "January 15, 2025 Monday")
-        # Temporarily set locale to English for date formatting
-        old_locale = locale.getlocale(locale.LC_TIME)
-        try:
-            locale.setlocale(locale.LC_TIME, 'en_US.UTF-8')
-        except:
-            try:
-                locale.setlocale(locale.LC_TIME, 'C')
-            except:
-                pass
-
-        date_str = current_time.strftime('%B %d, %Y %A')
-
-        # Restore original locale
-        try:
-            locale.setlocale(locale.LC_TIME, old_locale)
-        except:
-            pass
-
-        self.date_label.setText(date_str)
+        time_str = f"{current_time.hour:02d}:{current_time.minute:02d}:{current_time.second:02d}"
+        if time_str != self.time_text:
+            self.time_text = time_str
+            self.time_label.setText(time_str)
+
+        # Format date from name tables (e.g., "January 15, 2025 Monday") without
+        # touching the process-wide locale
+        today = current_time.date()
+        if today != self.shown_date:
+            self.shown_date = today
+            self.date_label.setText(format_long_date(today, self.language))
+            # A longer date may need a smaller font
+            self.schedule_font_fit()
+
+    def set_language(self, language: str):
+        """
+        Switch the language of the date line
+
+        Args:
+            language: Language code from src.utils.date_format
+        """
+        self.language = language
+        self.shown_date = None  # Force the date to be reformatted
+        self.update_time()
 
     def set_scale(self, scale):
         """Set the scale factor for the clock"""
         self.scale = scale
-        # Update font sizes
-        self.time_font.setPointSize(int(self.base_time_font_size * scale))
-        self.date_font.setPointSize(int(self.base_date_font_size * scale))
-        self.time_label.setFont(self.time_font)
-        self.date_label.setFont(self.date_font)
+        self.set_point_sizes(int(self.base_time_font_size * scale),
+                             int(self.base_date_font_size * scale))
+
+    def set_point_sizes(self, time_size: int, date_size: int):
+        """
+        Apply label font sizes, touching only the labels whose size changed
+
+        Each setFont triggers a relayout, so unchanged sizes are skipped.
+
+        Args:
+            time_size: Point size of the time label
+            date_size: Point size of the date label
+        """
+        if time_size != self.time_font.pointSize():
+            self.time_font.setPointSize(time_size)
+            self.time_label.setFont(self.time_font)
+        if date_size != self.date_font.pointSize():
+            self.date_font.setPointSize(date_size)
+            self.date_label.setFont(self.date_font)
+
+    def schedule_font_fit(self):
+        """Fit fonts on the next frame, merging any further requests until then"""
+        if not self.fit_timer.isActive():
+            self.fit_timer.start()
+
+    def apply_font_fit(self):
+        """Set the largest font sizes at which both labels fit the widget"""
+        layout = self.layout()
+        margins = layout.contentsMargins()
+        width = int((self.width() - margins.left() - margins.right()) * FONT_FIT_WIDTH)
+        # Four rows with equal stretch: spacer, time, date, spacer
+        row_height = (self.height() - margins.top() - margins.bottom() - 3 * layout.spacing()) // 4
+        if width <= 0 or row_height <= 0:
+            return
+
+        time_size = self.time_fitter.fit('00:00:00', width, row_height)
+        date_size = self.date_fitter.fit(self.date_label.text(), width, row_height)
+        self.scale = time_size / self.base_time_font_size
+        self.set_point_sizes(time_size, date_size)
 
     def resizeEvent(self, event):
         """Handle resize event to scale font based on widget size"""
         super().resizeEvent(event)
-        # Calculate scale based on widget width
-        width = self.width()
-        if width > 0:
-            # Scale font size based on width (baseline 500px = 1.0 scale)
-            scale = width / 500.0
-            scale = max(0.6, min(scale, 2.5))  # Limit between 0.6x and 2.5x
-            self.set_scale(scale)
+        self.schedule_font_fit()